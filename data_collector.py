@@ -18,12 +18,46 @@ import argparse
 import os
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
 import pandas as pd
 import yfinance as yf
 import requests
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow 미설치 시 pandas 기본 엔진 사용
+    pa = None
+
+
+class _EmptyHistory(Exception):
+    """조회 결과가 비어 있음 (빈 결과를 캐시하지 않기 위해 사용)"""
+
+
+@lru_cache(maxsize=32)
+def _fetch_history_cached(symbol: str, period: str) -> pd.DataFrame:
+    """yfinance 일봉 데이터 조회 (비어 있으면 예외를 발생시켜 lru_cache에 저장되지 않게 함)"""
+    data = yf.Ticker(symbol).history(period=period, interval="1d")
+    if data.empty:
+        raise _EmptyHistory(symbol)
+    return data
+
+
+def _fetch_history(symbol: str, period: str) -> pd.DataFrame:
+    """
+    yfinance 일봉 데이터 조회 (프로세스 내 캐시)
+    
+    같은 프로세스에서 동일한 (symbol, period)를 반복 조회할 때 네트워크 요청을 생략합니다.
+    네트워크 오류/요청 제한 등으로 비어 있는 결과는 캐시하지 않아 다음 호출에서 다시 조회합니다.
+    캐시된 DataFrame은 호출 측에서 복사해서 사용해야 합니다.
+    """
+    try:
+        return _fetch_history_cached(symbol, period)
+    except _EmptyHistory:
+        return pd.DataFrame()
+
 
 class IndexDataCollector:
     """주식 지수 데이터 수집기"""
@@ -91,9 +125,8 @@ class IndexDataCollector:
         try:
             print(f"Collecting data for {index_name} ({symbol})...")
             
-            # yfinance를 사용하여 데이터 수집
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period, interval="1d")
+            # yfinance를 사용하여 데이터 수집 (캐시 원본 보호를 위해 복사본 사용)
+            data = _fetch_history(symbol, period).copy()
             
             if data.empty:
                 print(f"Warning: No data found for {index_name}")
@@ -110,8 +143,7 @@ class IndexDataCollector:
                 print(f"  📅 S&P 500: 1957년 이후 데이터로 필터링 ({original_count} → {filtered_count} days)")
                 
             # 컬럼명 정리
-            data.index.name = 'Date'
-            data = data.round(2)  # 소수점 2자리로 반올림
+            data = data.rename_axis('Date').round(2)  # 소수점 2자리로 반올림
             
             # 데이터 완성도 검증
             expected_start = pd.to_datetime(self.SUPPORTED_INDICES[index_name]['expected_start']).date()
@@ -135,6 +167,28 @@ class IndexDataCollector:
             print(f"Error collecting data for {index_name}: {str(e)}")
             return None
     
+    def _read_data_file(self, filepath: Path) -> pd.DataFrame:
+        """
+        저장된 CSV 파일 읽기 (pyarrow CSV 리더 우선 사용)
+        
+        지수마다 시간대 오프셋이 달라 Date는 파싱하지 않고 현지 시각 문자열 그대로
+        인덱스로 둡니다. (pyarrow 타임스탬프 추론은 UTC로 변환되어 현지 날짜가 바뀜)
+        
+        Args:
+            filepath: CSV 파일 경로
+            
+        Returns:
+            Date 문자열을 인덱스로 하는 DataFrame
+        """
+        if pa is not None:
+            table = pa_csv.read_csv(
+                str(filepath),
+                convert_options=pa_csv.ConvertOptions(column_types={'Date': pa.string()})
+            )
+            return table.to_pandas().set_index('Date')
+        
+        return pd.read_csv(filepath, index_col=0, dtype={'Date': str})
+    
     def save_data(self, data: pd.DataFrame, index_name: str) -> str:
         """
         데이터를 CSV 파일로 저장
@@ -152,7 +206,8 @@ class IndexDataCollector:
         # 기존 데이터와 병합 (있는 경우)
         if filepath.exists():
             try:
-                existing_data = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                existing_data = self._read_data_file(filepath)
+                existing_data.index = pd.to_datetime(existing_data.index, utc=True).tz_convert(data.index.tz)
                 # 중복 제거하고 병합
                 combined_data = pd.concat([existing_data, data])
                 combined_data = combined_data[~combined_data.index.duplicated(keep='last')]
@@ -206,9 +261,10 @@ class IndexDataCollector:
             filepath = self.data_dir / f"{index_name}_data.csv"
             if filepath.exists():
                 try:
-                    data = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                    data = self._read_data_file(filepath)
                     expected_start = pd.to_datetime(info['expected_start']).date()
-                    actual_start = data.index.min().date()
+                    # ISO 형식 문자열이므로 사전순 최소/최대가 곧 시작/종료일
+                    actual_start = pd.to_datetime(data.index.min()[:10]).date()
                     
                     # 누락 연수 계산
                     missing_years = 0
@@ -221,7 +277,7 @@ class IndexDataCollector:
                         'Symbol': info['symbol'],
                         'Records': len(data),
                         'Start_Date': actual_start,
-                        'End_Date': data.index.max().date(),
+                        'End_Date': pd.to_datetime(data.index.max()[:10]).date(),
                         'Expected_Start': expected_start,
                         'Missing_Years': missing_years,
                         'File_Size_MB': round(filepath.stat().st_size / 1024 / 1024, 2)
@@ -1,11 +1,112 @@
 """
 성과 분석 모듈
 """
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 NumPy 누적 최댓값으로 계산
+    njit = None
+
+
+_ANN = 365.25  # 연환산 기준 일수
+_SQRT_ANN = math.sqrt(_ANN)
+
+
+def _max_peak_gap(returns: np.ndarray) -> float:
+    """누적 최고 수익률 대비 최대 하락폭을 한 번의 순회로 계산 (NaN이 있으면 NaN)
+    
+    numba가 설치되어 있으면 JIT 컴파일하여 사용
+    """
+    peak = returns[0]
+    max_gap = 0.0
+    for i in range(len(returns)):
+        if returns[i] > peak:
+            peak = returns[i]
+        gap = peak - returns[i]
+        if gap != gap:
+            return np.nan
+        if gap > max_gap:
+            max_gap = gap
+    return max_gap
+
+
+if njit is not None:
+    _max_peak_gap = njit(cache=True)(_max_peak_gap)
+
+
+def _drop_nan(values: np.ndarray) -> np.ndarray:
+    """NaN 제외 (합계가 NaN이 아니면 NaN이 없으므로 마스크 생성/복사 없이 그대로 반환)"""
+    with np.errstate(invalid='ignore'):
+        if not np.isnan(values.sum()):
+            return values
+    return values[~np.isnan(values)]
+
+
+def sample_mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """평균과 표본 표준편차(ddof=1)를 평균 한 번만 계산하여 함께 반환
+    
+    ndarray.mean/std(ddof=1)와 같은 순서로 합산하므로 결과가 동일함 (표본이 1개 이하이면 표준편차는 NaN)
+    """
+    mean = values.mean()
+    if len(values) < 2:
+        return mean, np.nan
+    deviations = values - mean
+    deviations *= deviations
+    return mean, np.sqrt(deviations.sum() / (len(values) - 1))
+
+
+def _fast_metrics(current_value: np.ndarray, invested_amount: np.ndarray, total_return: np.ndarray,
+                  drawdown: np.ndarray, risk_free_rate: float) -> Tuple:
+    """일별 평가 배열에서 수익률/CAGR/MDD/샤프/변동성/승률을 한 번에 계산
+    
+    일별 수익률(total_return 차분)은 한 번만 구해 샤프/변동성/승률이 공유함
+    drawdown이 None이면 평가금액/투자금으로 손실폭 계산
+    반환: (최종 수익률, CAGR, MDD, 샤프 지수, 변동성, 승률, 총 투자금, 최종 가치, 투자 일수, 투자 연수)
+    """
+    # 최종 수익률 계산
+    final_value = current_value[-1]
+    total_invested = invested_amount[-1]
+    final_return = (final_value - total_invested) / total_invested
+    
+    # CAGR 계산
+    days = len(current_value)
+    years = days / _ANN
+    cagr = (final_value / total_invested) ** (1/years) - 1 if years > 0 else 0
+    
+    # MDD 계산 (백테스터에서 계산된 drawdown의 최솟값이 가장 큰 손실, NaN 제외)
+    if drawdown is not None:
+        drawdown = _drop_nan(drawdown)
+        mdd = abs(drawdown.min()) if len(drawdown) else np.nan
+    else:
+        returns = current_value - invested_amount
+        returns /= invested_amount
+        if njit is not None:
+            mdd = _max_peak_gap(returns)
+        else:
+            drawdown = np.maximum.accumulate(returns)
+            drawdown -= returns
+            mdd = np.max(drawdown)
+    
+    # 일별 수익률 기준 샤프 지수/변동성/승률
+    sharpe_ratio = volatility = win_rate = 0
+    if days >= 2:
+        daily_changes = np.diff(total_return)
+        daily_changes = _drop_nan(daily_changes)
+        if len(daily_changes):
+            # 표본이 1개면 표준편차를 정의할 수 없음 (pandas std와 동일하게 NaN)
+            mean, std = sample_mean_std(daily_changes)
+            volatility = std * _SQRT_ANN
+            if std != 0:
+                sharpe_ratio = (mean * _ANN - risk_free_rate) / volatility
+            win_rate = np.count_nonzero(daily_changes > 0) / len(daily_changes)
+    
+    return final_return, cagr, mdd, sharpe_ratio, volatility, win_rate, total_invested, final_value, days, years
+
 
 class PerformanceAnalyzer:
     """성과 분석기"""
@@ -14,34 +115,22 @@ class PerformanceAnalyzer:
         self.risk_free_rate = 0.02  # 무위험 수익률 2%
     
     def calculate_metrics(self, backtest_result: Dict[str, Any]) -> Dict[str, Any]:
-        """성과 지표 계산"""
+        """성과 지표 계산 (컬럼 배열을 한 번만 꺼내 한 번에 계산)"""
         daily_returns = backtest_result['daily_returns']
         portfolio = backtest_result['portfolio']
         
         if daily_returns.empty:
             return self._empty_metrics()
         
-        # 최종 수익률 계산
-        final_value = daily_returns.iloc[-1]['current_value']
-        total_invested = daily_returns.iloc[-1]['invested_amount']
-        final_return = (final_value - total_invested) / total_invested
-        
-        # CAGR 계산
-        days = len(daily_returns)
-        years = days / 365.25
-        cagr = (final_value / total_invested) ** (1/years) - 1 if years > 0 else 0
-        
-        # MDD 계산
-        mdd = self._calculate_mdd(daily_returns)
-        
-        # 샤프 지수 계산
-        sharpe_ratio = self._calculate_sharpe_ratio(daily_returns)
-        
-        # 변동성 계산
-        volatility = self._calculate_volatility(daily_returns)
-        
-        # 승률 계산 (일별 수익률 기준)
-        win_rate = self._calculate_win_rate(daily_returns)
+        drawdown = daily_returns['drawdown'].to_numpy(np.float64) if 'drawdown' in daily_returns.columns else None
+        (final_return, cagr, mdd, sharpe_ratio, volatility, win_rate,
+         total_invested, final_value, days, years) = _fast_metrics(
+            daily_returns['current_value'].to_numpy(np.float64),
+            daily_returns['invested_amount'].to_numpy(np.float64),
+            daily_returns['total_return'].to_numpy(np.float64),
+            drawdown,
+            self.risk_free_rate
+        )
         
         return {
             'final_return': final_return,
@@ -58,83 +147,6 @@ class PerformanceAnalyzer:
             'investment_period_years': years
         }
     
-    def _calculate_mdd(self, daily_returns: pd.DataFrame) -> float:
-        """최대 손실(MDD) 계산"""
-        if daily_returns.empty:
-            return 0
-        
-        # 백테스터에서 계산된 drawdown 컬럼 사용
-        if 'drawdown' in daily_returns.columns:
-            # drawdown 컬럼의 최솟값이 MDD (가장 큰 손실)
-            return abs(daily_returns['drawdown'].min())
-        
-        # 백업: drawdown 컬럼이 없는 경우 기존 방식 사용
-        values = daily_returns['current_value'].values
-        invested = daily_returns['invested_amount'].values
-        
-        # 각 시점에서의 수익률
-        returns = (values - invested) / invested
-        
-        # 최고점 대비 하락폭 계산
-        peak = np.maximum.accumulate(returns)
-        drawdown = (peak - returns)
-        
-        return np.max(drawdown)
-    
-    def _calculate_sharpe_ratio(self, daily_returns: pd.DataFrame) -> float:
-        """샤프 지수 계산"""
-        if len(daily_returns) < 2:
-            return 0
-        
-        # 포트폴리오 수익률 기준으로 일별 수익률 계산
-        # total_return 컬럼의 일별 변화를 사용
-        daily_returns_df = daily_returns.copy()
-        daily_returns_df['portfolio_daily_return'] = daily_returns_df['total_return'].diff()
-        daily_returns_pct = daily_returns_df['portfolio_daily_return'].dropna()
-        
-        if daily_returns_pct.empty or daily_returns_pct.std() == 0:
-            return 0
-        
-        # 연평균 수익률과 변동성
-        mean_return = daily_returns_pct.mean() * 365.25
-        volatility = daily_returns_pct.std() * np.sqrt(365.25)
-        
-        return (mean_return - self.risk_free_rate) / volatility
-    
-    def _calculate_volatility(self, daily_returns: pd.DataFrame) -> float:
-        """변동성 계산"""
-        if len(daily_returns) < 2:
-            return 0
-        
-        # 포트폴리오 수익률 기준으로 일별 수익률 계산
-        # total_return 컬럼의 일별 변화를 사용
-        daily_returns_df = daily_returns.copy()
-        daily_returns_df['portfolio_daily_return'] = daily_returns_df['total_return'].diff()
-        daily_returns_pct = daily_returns_df['portfolio_daily_return'].dropna()
-        
-        if daily_returns_pct.empty:
-            return 0
-        
-        # 연환산 변동성
-        return daily_returns_pct.std() * np.sqrt(365.25)
-    
-    def _calculate_win_rate(self, daily_returns: pd.DataFrame) -> float:
-        """승률 계산"""
-        if len(daily_returns) < 2:
-            return 0
-        
-        # 일별 수익률 변화
-        daily_changes = daily_returns['total_return'].diff().dropna()
-        
-        if daily_changes.empty:
-            return 0
-        
-        # 상승 일수 / 전체 일수
-        win_days = (daily_changes > 0).sum()
-        total_days = len(daily_changes)
-        
-        return win_days / total_days
-    
     def _empty_metrics(self) -> Dict[str, Any]:
         """빈 지표 반환"""
         return {
@@ -152,6 +164,13 @@ class PerformanceAnalyzer:
             'investment_period_years': 0
         }
     
+    def calculate_comparison_metrics(self, comparison_result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """일시투자/적립투자 성과 지표를 한 번에 계산 (요약 출력과 Excel 출력에서 공유)"""
+        return {
+            'lump_sum': self.calculate_metrics(comparison_result['lump_sum']),
+            'dca': self.calculate_metrics(comparison_result['dca'])
+        }
+    
     def compare_strategies(self, lump_sum_metrics: Dict[str, Any], 
                           dca_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """전략 비교 분석"""
@@ -181,10 +200,13 @@ class PerformanceAnalyzer:
         
         return comparison
     
-    def generate_summary(self, comparison_result: Dict[str, Any]) -> str:
-        """분석 요약 생성"""
-        lump_sum_metrics = self.calculate_metrics(comparison_result['lump_sum'])
-        dca_metrics = self.calculate_metrics(comparison_result['dca'])
+    def generate_summary(self, comparison_result: Dict[str, Any],
+                         metrics: Dict[str, Dict[str, Any]] = None) -> str:
+        """분석 요약 생성 (metrics를 전달하면 재계산하지 않음)"""
+        if metrics is None:
+            metrics = self.calculate_comparison_metrics(comparison_result)
+        lump_sum_metrics = metrics['lump_sum']
+        dca_metrics = metrics['dca']
         
         summary = f"""
 === 일시투자 vs 적립투자 분석 결과 ===
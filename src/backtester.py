@@ -1,12 +1,105 @@
 """
 백테스팅 엔진 모듈
 """
+import weakref
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 NumPy 누적합으로 계산
+    njit = None
+
+
+# DataFrame별 파생 배열 캐시 ((id, 생성 함수) -> (약한 참조, 데이터 지문, 배열))
+_FRAME_ARRAYS: Dict[Tuple[int, Any], Tuple] = {}
+
+
+def cached_frame_arrays(data: pd.DataFrame, build):
+    """가격 DataFrame에서 build(data)로 만든 배열을 DataFrame별로 캐시하여 반환
+    
+    입력 DataFrame은 읽기 전용으로 간주하며 id와 약한 참조로 식별 (DataFrame이 해제되면 캐시도 제거)
+    행 수와 첫/마지막 Date가 캐시 시점과 다르면 다시 생성 (그 외 제자리 수정은 감지하지 않음)
+    """
+    key = (id(data), build)
+    dates = data['Date']
+    fingerprint = (len(dates), dates.iat[0], dates.iat[-1]) if len(dates) else (0,)
+    cached = _FRAME_ARRAYS.get(key)
+    if cached is not None and cached[0]() is data and cached[1] == fingerprint:
+        return cached[2]
+    
+    arrays = build(data)
+    _FRAME_ARRAYS[key] = (weakref.ref(data, lambda _: _FRAME_ARRAYS.pop(key, None)), fingerprint, arrays)
+    return arrays
+
+
+def _build_price_columns(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """가격 데이터의 (datetime64[D] 거래일, Date 원본 값, float64 종가) 배열"""
+    dates = data['Date'].to_numpy()
+    return dates.astype('datetime64[D]'), dates, data['Close'].to_numpy(np.float64)
+
+
+def _price_columns(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """가격 데이터의 (datetime64[D] 거래일, Date 원본 값, float64 종가) 배열
+    
+    같은 DataFrame으로 반복 백테스트하면 컬럼 조회/변환 없이 재사용
+    """
+    return cached_frame_arrays(data, _build_price_columns)
+
+
+def _accumulate_positions(prices: np.ndarray, invested_added: np.ndarray, shares_added: np.ndarray):
+    """일별 누적 투자금/보유 수량과 평가 지표, 전고점 대비 손실폭을 하루씩 한 번만 순회하며 계산
+    
+    numba가 설치되어 있으면 JIT 컴파일하여 사용 (보유 수량이 없는 날의 평가값은 0)
+    반환: (누적 투자금, 보유 수량, 평균 단가, 평가금액, 누적 수익률, 평균 단가 대비 수익률,
+          최고점 수익률, 손실폭)
+    """
+    n = len(prices)
+    invested = np.empty(n)
+    shares = np.empty(n)
+    average_price = np.empty(n)
+    current_value = np.empty(n)
+    total_return = np.empty(n)
+    daily_return = np.empty(n)
+    peak_return = np.empty(n)
+    drawdown = np.empty(n)
+    cumulative_invested = 0.0
+    cumulative_shares = 0.0
+    peak = 0.0
+    
+    for i in range(n):
+        cumulative_invested += invested_added[i]
+        cumulative_shares += shares_added[i]
+        invested[i] = cumulative_invested
+        shares[i] = cumulative_shares
+        if cumulative_shares > 0:
+            current_value[i] = cumulative_shares * prices[i]
+            average_price[i] = cumulative_invested / cumulative_shares
+            total_return[i] = (current_value[i] - cumulative_invested) / cumulative_invested
+            daily_return[i] = (prices[i] - average_price[i]) / average_price[i]
+        else:
+            current_value[i] = 0.0
+            average_price[i] = 0.0
+            total_return[i] = 0.0
+            daily_return[i] = 0.0
+        
+        # 누적 최고 수익률 (np.maximum.accumulate와 같이 NaN은 이후로 전파)
+        if i == 0 or total_return[i] > peak or total_return[i] != total_return[i]:
+            peak = total_return[i]
+        peak_return[i] = peak
+        drawdown[i] = total_return[i] - peak
+        if peak > 0:
+            drawdown[i] /= 1 + peak
+    
+    return invested, shares, average_price, current_value, total_return, daily_return, peak_return, drawdown
+
+
+if njit is not None:
+    _accumulate_positions = njit(cache=True)(_accumulate_positions)
+
 
 class Backtester:
     """백테스팅 엔진"""
@@ -25,76 +118,83 @@ class Backtester:
         
         return data
     
-    def get_investment_period_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        """투자 기간 데이터 필터링"""
+    def _investment_period_bounds(self, data: pd.DataFrame) -> Tuple[int, int]:
+        """투자 기간 [시작, 끝) 행 위치 (data는 load_data 결과처럼 Date 오름차순 정렬 상태)"""
         start_date = datetime(self.config.start_year, self.config.start_month, 1).date()
         end_date = start_date + relativedelta(years=self.config.investment_period_years)
         
-        return data[(data['Date'] >= start_date) & (data['Date'] < end_date)]
+        # 전체 행 비교 대신 캐시된 거래일 배열에서 이진 탐색으로 구간 위치를 찾음
+        days = _price_columns(data)[0]
+        start, end = np.searchsorted(days, np.array([start_date, end_date], dtype='datetime64[D]'))
+        return int(start), int(end)
+    
+    def get_investment_period_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """투자 기간 데이터 필터링 (복사 없이 슬라이싱)"""
+        start, end = self._investment_period_bounds(data)
+        return data.iloc[start:end]
     
     def calculate_daily_returns(self, data: pd.DataFrame, strategy_result: Dict[str, Any]) -> pd.DataFrame:
         """일별 수익률 계산"""
-        portfolio = strategy_result['portfolio']
         trades = strategy_result['trades']
         
-        # 투자 기간 데이터만 사용
-        period_data = self.get_investment_period_data(data)
+        # 투자 기간 데이터만 사용 (캐시된 컬럼 배열을 구간만큼 잘라 사용, DataFrame 슬라이스 생성 없음)
+        start, end = self._investment_period_bounds(data)
+        if end <= start:
+            return pd.DataFrame()
         
-        results = []
-        cumulative_invested = 0
-        cumulative_shares = 0
+        days, dates, prices = _price_columns(data)
+        day_numbers = days[start:end]
+        dates = dates[start:end]
+        prices = prices[start:end]
         
-        # 거래 일정을 딕셔너리로 변환
-        trade_schedule = {}
-        for trade in trades:
-            trade_date = pd.to_datetime(trade['date']).date()
-            trade_schedule[trade_date] = trade
+        # 거래일 위치에 매수 금액/수량을 놓고 일별 누적 투자금/보유 수량 계산
+        # (거래 날짜는 한 번에 변환하고 정렬된 거래일 배열에서 이진 탐색으로 위치 확인, 같은 날짜면 마지막 거래 사용)
+        invested_added = np.zeros(len(prices))
+        shares_added = np.zeros(len(prices))
+        if trades:
+            trade_days = pd.to_datetime([trade['date'] for trade in trades]).to_numpy().astype('datetime64[D]')
+            positions = np.searchsorted(day_numbers, trade_days)
+            matched = positions < len(day_numbers)
+            matched[matched] = day_numbers[positions[matched]] == trade_days[matched]
+            invested_added[positions[matched]] = [trade['amount'] for trade, hit in zip(trades, matched) if hit]
+            shares_added[positions[matched]] = [trade['shares'] for trade, hit in zip(trades, matched) if hit]
         
-        for idx, row in period_data.iterrows():
-            current_date = row['Date']
-            current_price = row['Close']
+        if njit is not None:
+            (cumulative_invested, cumulative_shares, average_price, current_value,
+             total_return, daily_return, peak_return, drawdown) = _accumulate_positions(prices, invested_added, shares_added)
+        else:
+            cumulative_invested = np.cumsum(invested_added)
+            cumulative_shares = np.cumsum(shares_added)
             
-            # 해당 날짜에 거래가 있는지 확인
-            if current_date in trade_schedule:
-                trade = trade_schedule[current_date]
-                cumulative_invested += trade['amount']
-                cumulative_shares += trade['shares']
+            # 평가 계산 (보유 수량이 없는 날은 0)
+            holding = cumulative_shares > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                current_value = np.where(holding, cumulative_shares * prices, 0.0)
+                average_price = np.where(holding, cumulative_invested / cumulative_shares, 0.0)
+                total_return = np.where(holding, (current_value - cumulative_invested) / cumulative_invested, 0.0)
+                daily_return = np.where(holding, (prices - average_price) / average_price, 0.0)
             
-            # 평가 계산
-            if cumulative_shares > 0:
-                current_value = cumulative_shares * current_price
-                average_price = cumulative_invested / cumulative_shares
-                total_return = (current_value - cumulative_invested) / cumulative_invested
-                daily_return = (current_price - average_price) / average_price
-            else:
-                current_value = 0
-                average_price = 0
-                total_return = 0
-                daily_return = 0
-            
-            results.append({
-                'date': current_date,
-                'price': current_price,
-                'invested_amount': cumulative_invested,
-                'shares': cumulative_shares,
-                'average_price': average_price,
-                'current_value': current_value,
-                'total_return': total_return,
-                'daily_return': daily_return
-            })
-        
-        # 전고점 수익률과 손실폭 계산
-        df = pd.DataFrame(results)
-        if not df.empty:
             # 최고점 수익률 (누적 최대값)
-            df['peak_return'] = df['total_return'].cummax()
+            peak_return = np.maximum.accumulate(total_return)
             
             # 올바른 Drawdown 계산: (현재 수익률 - 최고점 수익률) / (1 + 최고점 수익률)
-            # 단, 최고점 수익률이 0보다 클 때만 적용
-            df['drawdown'] = df.apply(lambda row: 
-                (row['total_return'] - row['peak_return']) / (1 + row['peak_return']) 
-                if row['peak_return'] > 0 
-                else row['total_return'] - row['peak_return'], axis=1)
+            # 단, 최고점 수익률이 0보다 클 때만 적용 (행 단위 apply 대신 배열 연산)
+            drawdown = total_return - peak_return
+            positive_peak = peak_return > 0
+            drawdown[positive_peak] /= 1 + peak_return[positive_peak]
+        
+        df = pd.DataFrame({
+            'date': dates,
+            'price': prices,
+            'invested_amount': cumulative_invested,
+            'shares': cumulative_shares,
+            'average_price': average_price,
+            'current_value': current_value,
+            'total_return': total_return,
+            'daily_return': daily_return,
+            'peak_return': peak_return,
+            'drawdown': drawdown
+        })
         
         return df
     
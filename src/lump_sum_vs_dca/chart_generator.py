@@ -1,33 +1,65 @@
 """
 일시투자 vs 적립투자 차트 생성 모듈
 """
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+import numpy as np
 import pandas as pd
 import os
+from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
-import seaborn as sns
 
-# 스타일 설정
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+# matplotlib/seaborn은 import 비용이 크므로 첫 차트 생성 시점까지 로딩을 미룸
+_pyplot = None
+
+
+def _load_pyplot():
+    """matplotlib.pyplot 지연 로딩 (최초 1회만 스타일 설정)"""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # 스타일 설정
+        plt.style.use('seaborn-v0_8-whitegrid')
+        sns.set_palette("husl")
+        _pyplot = plt
+    return _pyplot
 
 
 class ChartGenerator:
     """일시투자 vs 적립투자 차트 생성기"""
     
+    # 범례 공통 스타일
+    LEGEND_STYLE = dict(frameon=True, fancybox=True, shadow=True)
+    
+    # 폰트 목록 재로드/rcParams 설정은 프로세스당 한 번만 수행
+    _fonts_configured = False
+    
     def __init__(self, config):
         self.config = config
         self.chart_dir = config.charts_dir  # config에서 이미 설정된 경로 사용
+        
+        # 차트 제목/파일명 공통 문구 (설정값 기준으로 한 번만 생성)
+        self._period_str = f'({config.start_year}년 {config.start_month}월 ~ {config.investment_period_years}년간)'
+        self._file_suffix = f'{config.symbol}_{config.start_year}{config.start_month:02d}'
+        self._plt = _load_pyplot()
         self._setup_korean_fonts()
+        self._figure = None  # 차트 4개가 같은 크기이므로 Figure 하나를 비워가며 재사용
         
         # 차트 디렉토리가 없으면 생성
-        if self.chart_dir and not os.path.exists(self.chart_dir):
-            os.makedirs(self.chart_dir)
+        if self.chart_dir:
+            os.makedirs(self.chart_dir, exist_ok=True)
     
     def _setup_korean_fonts(self):
-        """한글 폰트 설정"""
+        """한글 폰트 설정 (프로세스당 한 번만 적용, 이후 생성되는 인스턴스는 설정 재사용)"""
+        if ChartGenerator._fonts_configured:
+            return
+        
+        import matplotlib.font_manager as fm
+        plt = self._plt
+        
         # 폰트 캐시 클리어 및 시스템 폰트 재로드
         fm._get_fontconfig_fonts.cache_clear()
         fm.fontManager.__init__()
@@ -51,12 +83,55 @@ class ChartGenerator:
         
         plt.rcParams['axes.unicode_minus'] = False
         
-        # 차트 품질 설정
-        plt.rcParams['figure.dpi'] = 300
-        plt.rcParams['savefig.dpi'] = 300
-        plt.rcParams['savefig.bbox'] = 'tight'
+        # 차트 품질 설정 (파일 출력 전용이므로 150dpi, 여백은 constrained 레이아웃이 처리)
+        plt.rcParams['figure.dpi'] = 150
+        plt.rcParams['savefig.dpi'] = 150
+        
+        ChartGenerator._fonts_configured = True
     
+    def _get_figure(self):
+        """재사용 Figure 반환 (이전 차트 내용은 비움)"""
+        if self._figure is None:
+            self._figure = self._plt.figure(figsize=(15, 9), layout='constrained')
+        else:
+            self._figure.clear()
+        return self._figure
+    
+    def close_figure(self):
+        """재사용 중인 Figure 해제"""
+        if self._figure is not None:
+            self._plt.close(self._figure)
+            self._figure = None
+    
+    def _style_axes(self, ax, title: str, xlabel: str, ylabel: str, subtitle: str = None):
+        """차트 공통 제목, 축 라벨, 격자 설정"""
+        ax.set_title(f'{self.config.symbol} {title}\n{subtitle or self._period_str}', 
+                    fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.grid(True, alpha=0.3)
+    
+    @staticmethod
+    def _ensure_datetime_dates(*frames: pd.DataFrame):
+        """일별 데이터의 date 컬럼을 datetime으로 변환 (이미 datetime이면 다시 파싱하지 않음)"""
+        for df in frames:
+            if not pd.api.types.is_datetime64_any_dtype(df['date']):
+                df['date'] = pd.to_datetime(df['date'])
     
+    def _maybe_decimate(self, df: pd.DataFrame, target: int = 2000) -> pd.DataFrame:
+        """그리기용 데이터 간격 축소 (마지막 행은 항상 포함)"""
+        step = max(1, len(df) // target)
+        if step == 1:
+            return df
+        
+        # 일정 간격으로 샘플링하되 최종 시점이 누락되지 않도록 마지막 행 추가
+        # (리스트를 늘려가지 않고 필요한 크기의 인덱스 배열을 미리 할당)
+        last = len(df) - 1
+        sampled = last // step + 1
+        indices = np.empty(sampled + (last % step != 0), dtype=np.intp)
+        indices[:sampled] = np.arange(0, len(df), step)
+        indices[sampled:] = last
+        return df.iloc[indices]
     
     def generate_all_charts(self, comparison_result: Dict[str, Any]) -> Dict[str, str]:
         """모든 차트 생성"""
@@ -80,48 +155,49 @@ class ChartGenerator:
         print("  [4/4] 투자 타이밍 효과 차트...")
         chart_files['timing_effect'] = self.create_timing_effect_chart(comparison_result)
         
+        self.close_figure()
         print("📊 모든 차트 생성 완료!")
         return chart_files
     
     def create_cumulative_returns_chart(self, comparison_result: Dict[str, Any]) -> str:
         """누적 수익률 비교 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure()
+        ax = fig.subplots()
         
         # 데이터 준비
         lump_sum_data = comparison_result['lump_sum']['daily_returns']
         dca_data = comparison_result['dca']['daily_returns']
         
-        # 날짜 변환
-        lump_sum_data['date'] = pd.to_datetime(lump_sum_data['date'])
-        dca_data['date'] = pd.to_datetime(dca_data['date'])
+        # 날짜 변환 (앞선 차트에서 변환했으면 생략)
+        self._ensure_datetime_dates(lump_sum_data, dca_data)
         
         # 누적 수익률 계산 (%)
         lump_sum_data['cumulative_return_pct'] = lump_sum_data['total_return'] * 100
         dca_data['cumulative_return_pct'] = dca_data['total_return'] * 100
         
+        # 그리기용 데이터 (장기 일봉은 간격 축소)
+        lump_sum_plot = self._maybe_decimate(lump_sum_data)
+        dca_plot = self._maybe_decimate(dca_data)
+        
         # 차트 그리기
-        ax.plot(lump_sum_data['date'], lump_sum_data['cumulative_return_pct'], 
+        ax.plot(lump_sum_plot['date'], lump_sum_plot['cumulative_return_pct'], 
                 label='일시투자', linewidth=2.5, color='#1f77b4')
-        ax.plot(dca_data['date'], dca_data['cumulative_return_pct'], 
+        ax.plot(dca_plot['date'], dca_plot['cumulative_return_pct'], 
                 label='적립투자', linewidth=2.5, color='#ff7f0e')
         
         # 0% 기준선
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.7, linewidth=1)
         
         # 차트 설정
-        ax.set_title(f'{self.config.symbol} 누적 수익률 비교\n({self.config.start_year}년 {self.config.start_month}월 ~ {self.config.investment_period_years}년간)', 
-                    fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('날짜', fontsize=12)
-        ax.set_ylabel('누적 수익률 (%)', fontsize=12)
-        ax.legend(fontsize=12, loc='best', frameon=True, fancybox=True, shadow=True)
-        ax.grid(True, alpha=0.3)
+        self._style_axes(ax, '누적 수익률 비교', '날짜', '누적 수익률 (%)')
+        ax.legend(fontsize=12, loc='best', **self.LEGEND_STYLE)
         
         # Y축 포맷 (% 표시)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.1f}%'))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, _: f'{x:.1f}%'))
         
         # 최종 수익률 표시
-        final_lump_sum = lump_sum_data['cumulative_return_pct'].iloc[-1]
-        final_dca = dca_data['cumulative_return_pct'].iloc[-1]
+        final_lump_sum = lump_sum_data['cumulative_return_pct'].to_numpy()[-1]
+        final_dca = dca_data['cumulative_return_pct'].to_numpy()[-1]
         
         # 텍스트 박스 (왼쪽 하단에 배치)
         textstr = f'최종 수익률\n일시투자: {final_lump_sum:.2f}%\n적립투자: {final_dca:.2f}%\n차이: {final_lump_sum - final_dca:.2f}%p'
@@ -129,55 +205,51 @@ class ChartGenerator:
         ax.text(0.02, 0.35, textstr, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=props)
         
-        plt.tight_layout()
-        
         # 파일 저장
-        filename = f'누적수익률비교_{self.config.symbol}_{self.config.start_year}{self.config.start_month:02d}.png'
-        filepath = os.path.join(self.chart_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f'누적수익률비교_{self._file_suffix}.png'
+        filepath = str(Path(self.chart_dir) / filename)
+        fig.savefig(filepath, dpi=150)
         
         return filepath
     
     def create_portfolio_value_chart(self, comparison_result: Dict[str, Any]) -> str:
         """포트폴리오 가치 변화 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure()
+        ax = fig.subplots()
         
         # 데이터 준비
         lump_sum_data = comparison_result['lump_sum']['daily_returns']
         dca_data = comparison_result['dca']['daily_returns']
         
-        # 날짜 변환
-        lump_sum_data['date'] = pd.to_datetime(lump_sum_data['date'])
-        dca_data['date'] = pd.to_datetime(dca_data['date'])
+        # 날짜 변환 (앞선 차트에서 변환했으면 생략)
+        self._ensure_datetime_dates(lump_sum_data, dca_data)
+        
+        # 그리기용 데이터 (장기 일봉은 간격 축소)
+        lump_sum_plot = self._maybe_decimate(lump_sum_data)
+        dca_plot = self._maybe_decimate(dca_data)
         
         # 차트 그리기
-        ax.plot(lump_sum_data['date'], lump_sum_data['current_value'], 
+        ax.plot(lump_sum_plot['date'], lump_sum_plot['current_value'], 
                 label='일시투자 포트폴리오', linewidth=2.5, color='#1f77b4')
-        ax.plot(dca_data['date'], dca_data['current_value'], 
+        ax.plot(dca_plot['date'], dca_plot['current_value'], 
                 label='적립투자 포트폴리오', linewidth=2.5, color='#ff7f0e')
         
         # 투자원금 라인 (적립투자는 계단식 증가)
-        ax.plot(lump_sum_data['date'], lump_sum_data['invested_amount'], 
+        ax.plot(lump_sum_plot['date'], lump_sum_plot['invested_amount'], 
                 label='일시투자 원금', linewidth=2, linestyle='--', color='#1f77b4', alpha=0.7)
-        ax.plot(dca_data['date'], dca_data['invested_amount'], 
+        ax.plot(dca_plot['date'], dca_plot['invested_amount'], 
                 label='적립투자 원금', linewidth=2, linestyle='--', color='#ff7f0e', alpha=0.7)
         
         # 차트 설정
-        ax.set_title(f'{self.config.symbol} 포트폴리오 가치 변화\n({self.config.start_year}년 {self.config.start_month}월 ~ {self.config.investment_period_years}년간)', 
-                    fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('날짜', fontsize=12)
-        ax.set_ylabel('포트폴리오 가치', fontsize=12)
-        ax.legend(fontsize=10, loc='upper left', frameon=True, fancybox=True, shadow=True, 
-                 bbox_to_anchor=(0.02, 0.98))
-        ax.grid(True, alpha=0.3)
+        self._style_axes(ax, '포트폴리오 가치 변화', '날짜', '포트폴리오 가치')
+        ax.legend(fontsize=10, loc='upper left', bbox_to_anchor=(0.02, 0.98), **self.LEGEND_STYLE)
         
         # Y축 포맷 (천만 단위)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x/1e7:.1f}천만'))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, _: f'{x/1e7:.1f}천만'))
         
         # 최종 가치 표시
-        final_lump_sum_value = lump_sum_data['current_value'].iloc[-1]
-        final_dca_value = dca_data['current_value'].iloc[-1]
+        final_lump_sum_value = lump_sum_data['current_value'].to_numpy()[-1]
+        final_dca_value = dca_data['current_value'].to_numpy()[-1]
         
         # 텍스트 박스 (왼쪽 하단에 배치)
         textstr = f'최종 포트폴리오 가치\n일시투자: {final_lump_sum_value:,.0f}\n적립투자: {final_dca_value:,.0f}\n차이: {final_lump_sum_value - final_dca_value:,.0f}'
@@ -185,116 +257,92 @@ class ChartGenerator:
         ax.text(0.02, 0.35, textstr, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=props)
         
-        plt.tight_layout()
-        
         # 파일 저장
-        filename = f'포트폴리오가치_{self.config.symbol}_{self.config.start_year}{self.config.start_month:02d}.png'
-        filepath = os.path.join(self.chart_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f'포트폴리오가치_{self._file_suffix}.png'
+        filepath = str(Path(self.chart_dir) / filename)
+        fig.savefig(filepath, dpi=150)
         
         return filepath
     
     def create_mdd_comparison_chart(self, comparison_result: Dict[str, Any]) -> str:
         """MDD 비교 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure()
+        ax = fig.subplots()
         
         # 데이터 준비
         lump_sum_data = comparison_result['lump_sum']['daily_returns']
         dca_data = comparison_result['dca']['daily_returns']
         
-        # 날짜 변환
-        lump_sum_data['date'] = pd.to_datetime(lump_sum_data['date'])
-        dca_data['date'] = pd.to_datetime(dca_data['date'])
+        # 날짜 변환 (앞선 차트에서 변환했으면 생략)
+        self._ensure_datetime_dates(lump_sum_data, dca_data)
         
         # Drawdown을 백분율로 변환
         lump_sum_data['drawdown_pct'] = lump_sum_data['drawdown'] * 100
         dca_data['drawdown_pct'] = dca_data['drawdown'] * 100
         
+        # 그리기용 데이터 (장기 일봉은 간격 축소, MDD 수치는 원본 기준)
+        lump_sum_plot = self._maybe_decimate(lump_sum_data)
+        dca_plot = self._maybe_decimate(dca_data)
+        
         # Drawdown 시계열 차트 (채워진 라인 + 투명도로 겹침 인식)
         # 일시투자 (파란색, 실선) - 투명도를 높여서 겹치는 부분이 보이도록
-        ax.fill_between(lump_sum_data['date'], lump_sum_data['drawdown_pct'], 0,
+        ax.fill_between(lump_sum_plot['date'], lump_sum_plot['drawdown_pct'], 0,
                        color='#1f77b4', alpha=0.5, label='일시투자')
-        ax.plot(lump_sum_data['date'], lump_sum_data['drawdown_pct'], 
+        ax.plot(lump_sum_plot['date'], lump_sum_plot['drawdown_pct'], 
                 linewidth=2.5, color='#1f77b4', alpha=0.8, linestyle='-')
         
         # 적립투자 (주황색, 점선) - 투명도를 높여서 겹치는 부분이 보이도록
-        ax.fill_between(dca_data['date'], dca_data['drawdown_pct'], 0,
+        ax.fill_between(dca_plot['date'], dca_plot['drawdown_pct'], 0,
                        color='#ff7f0e', alpha=0.5, label='적립투자')
-        ax.plot(dca_data['date'], dca_data['drawdown_pct'], 
+        ax.plot(dca_plot['date'], dca_plot['drawdown_pct'], 
                 linewidth=2.5, color='#ff7f0e', alpha=0.8, linestyle='--')
         
         # 차트 설정
-        ax.set_title(f'{self.config.symbol} 손실폭(Drawdown) 비교\n({self.config.start_year}년 {self.config.start_month}월 ~ {self.config.investment_period_years}년간)', 
-                    fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('날짜', fontsize=12)
-        ax.set_ylabel('손실폭 (%)', fontsize=12)
-        ax.legend(fontsize=11, frameon=True, fancybox=True, shadow=True, loc='best')
-        ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.1f}%'))
+        self._style_axes(ax, '손실폭(Drawdown) 비교', '날짜', '손실폭 (%)')
+        ax.legend(fontsize=11, loc='best', **self.LEGEND_STYLE)
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, _: f'{x:.1f}%'))
         
-        # MDD 정보 텍스트 박스
-        lump_sum_mdd = lump_sum_data['drawdown_pct'].min()
-        dca_mdd = dca_data['drawdown_pct'].min()
+        # MDD 정보 텍스트 박스 (컬럼 배열에서 NaN 제외 최솟값)
+        lump_sum_mdd = np.nanmin(lump_sum_data['drawdown_pct'].to_numpy())
+        dca_mdd = np.nanmin(dca_data['drawdown_pct'].to_numpy())
         
         info_text = f'최대 손실폭(MDD)\n일시투자: {lump_sum_mdd:.2f}%\n적립투자: {dca_mdd:.2f}%'
         props = dict(boxstyle='round', facecolor='wheat', alpha=0.8)
         ax.text(0.02, 0.25, info_text, transform=ax.transAxes, fontsize=11,
                 verticalalignment='top', bbox=props)
         
-        plt.tight_layout()
-        
         # 파일 저장
-        filename = f'MDD비교_{self.config.symbol}_{self.config.start_year}{self.config.start_month:02d}.png'
-        filepath = os.path.join(self.chart_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f'MDD비교_{self._file_suffix}.png'
+        filepath = str(Path(self.chart_dir) / filename)
+        fig.savefig(filepath, dpi=150)
         
         return filepath
     
     def create_timing_effect_chart(self, comparison_result: Dict[str, Any]) -> str:
         """투자 타이밍 효과 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure()
+        ax = fig.subplots()
         
         # 적립투자 거래 데이터 분석
         dca_trades = comparison_result['dca']['trades']
         dca_daily_returns = comparison_result['dca']['daily_returns']
         
-        # 각 거래의 최종 기여도 계산
-        trade_contributions = []
-        final_price = dca_daily_returns['price'].iloc[-1]
-        
-        for trade in dca_trades:
-            trade_date = pd.to_datetime(trade['date'])
-            shares_bought = trade['shares']
-            price_paid = trade['price']
-            
-            # 해당 투자의 최종 수익률
-            final_return = (final_price - price_paid) / price_paid * 100
-            # 해당 투자가 최종 포트폴리오에 기여한 금액
-            contribution = shares_bought * (final_price - price_paid)
-            
-            trade_contributions.append({
-                'date': trade_date,
-                'month_year': trade_date.strftime('%Y-%m'),
-                'price_paid': price_paid,
-                'final_return': final_return,
-                'contribution': contribution,
-                'investment_amount': trade['amount']
-            })
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame(trade_contributions)
-        
-        # 월별로 그룹화
-        df['year_month'] = df['date'].dt.to_period('M')
+        # 거래 내역을 데이터프레임으로 변환 (date, price, amount, shares)
+        final_price = dca_daily_returns['price'].to_numpy()[-1]
+        df = pd.DataFrame(dca_trades).rename(columns={'price': 'price_paid', 'amount': 'investment_amount'})
+        df['date'] = pd.to_datetime(df['date'])
+        df['month_year'] = df['date'].dt.strftime('%Y-%m')
+        
+        # 각 거래의 최종 수익률 및 최종 포트폴리오 기여 금액 계산
+        df['final_return'] = (final_price - df['price_paid']) / df['price_paid'] * 100
+        df['contribution'] = df['shares'] * (final_price - df['price_paid'])
         
         # 차트 그리기 - 이중 Y축
         ax2 = ax.twinx()
         
         # 막대 차트: 각 월의 투자 기여도
         bars = ax.bar(range(len(df)), df['contribution'], 
-                     color=['green' if x > 0 else 'red' for x in df['contribution']], 
+                     color=df['contribution'].gt(0).map({True: 'green', False: 'red'}).tolist(), 
                      alpha=0.7, label='투자 기여도')
         
         # 라인 차트: 해당 월의 매수 가격
@@ -303,15 +351,13 @@ class ChartGenerator:
                 label='매수 가격')
         
         # X축 라벨 설정
-        ax.set_xticks(range(0, len(df), max(1, len(df)//12)))  # 최대 12개 라벨
-        ax.set_xticklabels([df.iloc[i]['month_year'] for i in range(0, len(df), max(1, len(df)//12))], 
-                          rotation=45)
+        label_step = max(1, len(df)//12)  # 최대 12개 라벨
+        ax.set_xticks(range(0, len(df), label_step))
+        ax.set_xticklabels(df['month_year'].iloc[::label_step], rotation=45)
         
         # 차트 설정
-        ax.set_title(f'{self.config.symbol} 적립투자 타이밍 효과 분석\n(각 월별 투자의 최종 기여도)', 
-                    fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('투자 시기', fontsize=12)
-        ax.set_ylabel('투자 기여도', fontsize=12)
+        self._style_axes(ax, '적립투자 타이밍 효과 분석', '투자 시기', '투자 기여도', 
+                         subtitle='(각 월별 투자의 최종 기여도)')
         ax2.set_ylabel('매수 가격', fontsize=12)
         
         # Y축 포맷 (3자리 단위 구분)
@@ -325,18 +371,16 @@ class ChartGenerator:
             else:  # 천 미만
                 return f'{x:.0f}'
         
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(format_value))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(format_value))
         
         # 범례
         lines1, labels1 = ax.get_legend_handles_labels()
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax.legend(lines1 + lines2, labels1 + labels2, loc='upper right', fontsize=10, 
-                 frameon=True, fancybox=True, shadow=True, bbox_to_anchor=(0.98, 0.98))
-        
-        ax.grid(True, alpha=0.3)
+                 bbox_to_anchor=(0.98, 0.98), **self.LEGEND_STYLE)
         
         # 통계 정보 텍스트
-        positive_months = sum(1 for x in df['contribution'] if x > 0)
+        positive_months = int(df['contribution'].gt(0).sum())
         total_months = len(df)
         avg_contribution = df['contribution'].mean()
         
@@ -345,12 +389,9 @@ class ChartGenerator:
         ax.text(0.02, 0.35, textstr, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=props)
         
-        plt.tight_layout()
-        
         # 파일 저장
-        filename = f'투자타이밍효과_{self.config.symbol}_{self.config.start_year}{self.config.start_month:02d}.png'
-        filepath = os.path.join(self.chart_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f'투자타이밍효과_{self._file_suffix}.png'
+        filepath = str(Path(self.chart_dir) / filename)
+        fig.savefig(filepath, dpi=150)
         
         return filepath
\ No newline at end of file
@@ -62,8 +62,7 @@ class LumpSumVsDcaConfig:
         ]
         
         for directory in directories:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            os.makedirs(directory, exist_ok=True)
     
     def set_backtest_type(self, backtest_type: str):
         """백테스트 타입 설정 (detail 또는 rolling)"""
@@ -88,8 +87,7 @@ class LumpSumVsDcaConfig:
         self.charts_dir = self.result_session_dir
         
         # 디렉토리 생성
-        if not os.path.exists(self.result_session_dir):
-            os.makedirs(self.result_session_dir)
+        os.makedirs(self.result_session_dir, exist_ok=True)
         
         return self.result_session_dir
     
@@ -131,18 +129,18 @@ class LumpSumVsDcaConfig:
     
     def _get_unique_directory_name(self, base_name: str) -> str:
         """중복 디렉토리명 처리 - 번호 추가"""
-        base_path = os.path.join(self.results_base_dir, self.backtest_type, base_name)
+        parent_dir = os.path.join(self.results_base_dir, self.backtest_type)
         
-        if not os.path.exists(base_path):
+        # 상위 디렉토리 항목을 한 번만 읽어 메모리에서 중복 확인
+        existing = set(os.listdir(parent_dir)) if os.path.isdir(parent_dir) else set()
+        
+        if base_name not in existing:
             return base_name
         
         counter = 1
-        while True:
-            new_name = f"{base_name}({counter})"
-            new_path = os.path.join(self.results_base_dir, self.backtest_type, new_name)
-            if not os.path.exists(new_path):
-                return new_name
+        while f"{base_name}({counter})" in existing:
             counter += 1
+        return f"{base_name}({counter})"
     
     
     def __str__(self):
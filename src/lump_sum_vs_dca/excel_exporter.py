@@ -1,15 +1,99 @@
 """
 Excel 출력 모듈
 """
+import re
+from copy import copy
+import numpy as np
 import pandas as pd
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles.numbers import FORMAT_NUMBER_COMMA_SEPARATED1, FORMAT_PERCENTAGE_00
+from openpyxl.utils import get_column_letter
 import os
 from typing import Dict, Any
 from datetime import datetime
 
+# 공통 스타일 (모듈 로드 시 한 번만 생성하여 재사용)
+_BOLD = Font(bold=True)
+_TITLE_FONT = Font(bold=True, size=14)
+_CENTER = Alignment(horizontal="center")
+_RIGHT = Alignment(horizontal="right")
+_LEFT = Alignment(horizontal="left")
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_FILL_COMMON = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")  # 연한 회색
+_FILL_LUMP = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")  # 연한 파란색
+_FILL_DCA = PatternFill(start_color="F0FFF0", end_color="F0FFF0", fill_type="solid")  # 연한 초록색
+
+# 숫자 서식별 표시 너비 추정치 (고정 서식 컬럼은 셀마다 길이를 계산하지 않음)
+_FORMAT_WIDTH_HINTS = {
+    "#,##0": 14,
+    "#,##0.00": 14,
+    FORMAT_PERCENTAGE_00: 10,
+}
+
+# 헤더 키워드별 (서식 유형, 숫자 서식) 규칙 (앞선 규칙 우선)
+_HEADER_FMT_RULES = [
+    (re.compile(r'날짜|date'), 'date', None),  # 날짜 형식
+    (re.compile(r'수익률|return'), 'return', FORMAT_PERCENTAGE_00),  # 수익률 형식
+    (re.compile(r'금액|가치|가격|amount|value|price'), 'number', "#,##0"),  # 금액 형식 (소수점 없음)
+    (re.compile(r'수량|평균단가|shares|average_price'), 'number', "#,##0.00"),  # 수량 및 평단가 형식 (소수점 2자리)
+    (re.compile(r'고점대비손실폭'), 'number', "0.00%"),  # 손실폭 형식 (소수점 2자리 퍼센트)
+]
+_COMMON_COLUMN_PATTERN = re.compile(r'날짜|종가|구분|매수일|매수가격')
+
+# 요약 시트 지표 행 라벨별 숫자 서식 규칙 ('최종 가치'는 정확히 일치할 때만 적용)
+_ROW_LABEL_FMT_RULES = [
+    (re.compile(r'샤프 지수'), "0.00"),  # 샤프 지수 형식 (소수점 2자리)
+    (re.compile(r'CAGR|MDD|변동성|최종 수익률'), FORMAT_PERCENTAGE_00),  # 퍼센트 지표 형식
+]
+
+
+def _classify_header(header) -> tuple:
+    """헤더로 컬럼 서식 결정: (색상, 서식 유형, 숫자 서식)"""
+    header_value = str(header) if header else ""
+    
+    # 컬럼 유형별 색상 결정
+    if _COMMON_COLUMN_PATTERN.search(header_value):
+        fill = _FILL_COMMON
+    elif '일시투자' in header_value:
+        fill = _FILL_LUMP
+    elif '적립투자' in header_value:
+        fill = _FILL_DCA
+    else:
+        fill = _FILL_COMMON
+    
+    for pattern, kind, num_fmt in _HEADER_FMT_RULES:
+        if pattern.search(header_value):
+            return fill, kind, num_fmt
+    return fill, None, None
+
+
+def _classify_row_label(label):
+    """첫 번째 열 라벨로 지표 행 숫자 서식 결정"""
+    if label == '최종 가치':
+        return "#,##0"  # 최종 가치 행 (금액 형식)
+    row_label = str(label)
+    for pattern, num_fmt in _ROW_LABEL_FMT_RULES:
+        if pattern.search(row_label):
+            return num_fmt
+    return None
+
+
+def _is_numeric(value) -> bool:
+    """숫자 타입 확인 (numpy 타입 포함, bool 제외)"""
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def _display_length(value) -> int:
+    """셀 표시 길이 (한글은 2배 가중치 적용)"""
+    return sum(2 if ord(c) > 127 else 1 for c in str(value))
+
 
 class ExcelExporter:
     """Excel 출력 클래스"""
@@ -19,24 +103,22 @@ class ExcelExporter:
         self.workbook = None
         self.filename = None
     
-    def export_analysis(self, comparison_result: Dict[str, Any], analyzer) -> str:
-        """분석 결과를 Excel로 출력"""
+    def export_analysis(self, comparison_result: Dict[str, Any], analyzer,
+                        metrics: Dict[str, Dict[str, Any]] = None) -> str:
+        """분석 결과를 Excel로 출력 (metrics를 전달하면 지표를 재계산하지 않음)"""
         
         # 파일 경로 생성 (새로운 구조 사용)
         self.filename = self.config.get_excel_filename()
         filepath = self.config.get_excel_filepath()
         
-        # 워크북 생성
-        self.workbook = openpyxl.Workbook()
-        
-        # 기본 시트 삭제
-        self.workbook.remove(self.workbook.active)
+        # 워크북 생성 (write-only: 셀을 메모리에 유지하지 않고 행 단위로 기록)
+        self.workbook = openpyxl.Workbook(write_only=True)
         
         # 각 시트 생성
         self._create_backtest_settings_sheet()
         self._create_purchase_history_sheet(comparison_result)
         self._create_daily_returns_sheet(comparison_result)
-        self._create_analysis_summary_sheet(comparison_result, analyzer)
+        self._create_analysis_summary_sheet(comparison_result, analyzer, metrics)
         
         # 파일 저장
         self.workbook.save(filepath)
@@ -48,71 +130,56 @@ class ExcelExporter:
         ws = self.workbook.create_sheet("매수 내역")
         
         # 헤더 설정
-        headers = ['구분', '매수일', '매수가격', '매수금액', '매수수량', '누적수량', '평단가']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center")
-        
-        # 데이터 입력
-        row = 2
-        
-        # 일시투자 데이터
-        lump_sum_trades = comparison_result['lump_sum']['trades']
-        cumulative_shares = 0
-        cumulative_invested = 0
-        
-        for trade in lump_sum_trades:
-            cumulative_shares += trade['shares']
-            cumulative_invested += trade['amount']
-            avg_price = cumulative_invested / cumulative_shares
-            
-            ws.cell(row=row, column=1, value="일시투자")
-            ws.cell(row=row, column=2, value=trade['date'])
-            ws.cell(row=row, column=3, value=trade['price'])
-            ws.cell(row=row, column=4, value=trade['amount'])
-            ws.cell(row=row, column=5, value=trade['shares'])
-            ws.cell(row=row, column=6, value=cumulative_shares)
-            ws.cell(row=row, column=7, value=avg_price)
-            row += 1
-        
-        # 적립투자 데이터
-        dca_trades = comparison_result['dca']['trades']
-        cumulative_shares = 0
-        cumulative_invested = 0
-        
-        for trade in dca_trades:
-            cumulative_shares += trade['shares']
-            cumulative_invested += trade['amount']
-            avg_price = cumulative_invested / cumulative_shares
-            
-            ws.cell(row=row, column=1, value="적립투자")
-            ws.cell(row=row, column=2, value=trade['date'])
-            ws.cell(row=row, column=3, value=trade['price'])
-            ws.cell(row=row, column=4, value=trade['amount'])
-            ws.cell(row=row, column=5, value=trade['shares'])
-            ws.cell(row=row, column=6, value=cumulative_shares)
-            ws.cell(row=row, column=7, value=avg_price)
-            row += 1
-        
-        # 셀 서식 적용
-        self._apply_cell_formatting(ws)
+        rows = [['구분', '매수일', '매수가격', '매수금액', '매수수량', '누적수량', '평단가']]
+        
+        # 데이터 입력 (전략별 행을 미리 만들어 한 번에 추가)
+        for label, strategy in [("일시투자", 'lump_sum'), ("적립투자", 'dca')]:
+            rows.extend(self._build_purchase_rows(label, comparison_result[strategy]['trades']))
+        
+        # 셀 서식 적용 후 기록
+        self._append_formatted_rows(ws, rows)
+    
+    def _build_purchase_rows(self, label: str, trades: list) -> list:
+        """매수 내역 행 목록 생성 (구분, 매수일, 매수가격, 매수금액, 매수수량, 누적수량, 평단가)"""
+        if not trades:
+            return []
+        
+        count = len(trades)
+        prices = np.fromiter((t['price'] for t in trades), dtype=np.float64, count=count)
+        amounts = np.fromiter((t['amount'] for t in trades), dtype=np.float64, count=count)
+        shares = np.fromiter((t['shares'] for t in trades), dtype=np.float64, count=count)
+        
+        # 누적 수량 및 평단가 (누적 투자금 / 누적 수량)
+        cumulative_shares = shares.cumsum()
+        avg_prices = amounts.cumsum() / cumulative_shares
+        
+        return [[label, trade['date'], price, amount, share, cum_share, avg_price]
+                for trade, price, amount, share, cum_share, avg_price in zip(
+                    trades, prices.tolist(), amounts.tolist(), shares.tolist(),
+                    cumulative_shares.tolist(), avg_prices.tolist())]
     
     def _create_daily_returns_sheet(self, comparison_result: Dict[str, Any]):
         """일 수익률 변화 시트 생성"""
         ws = self.workbook.create_sheet("일 수익률 변화")
         
-        # 일시투자와 적립투자 데이터 병합
-        lump_sum_df = comparison_result['lump_sum']['daily_returns'].copy()
-        dca_df = comparison_result['dca']['daily_returns'].copy()
-        
-        # 컬럼명 변경
-        lump_sum_df.columns = [f'일시투자_{col}' if col != 'date' else col for col in lump_sum_df.columns]
-        dca_df.columns = [f'적립투자_{col}' if col != 'date' else col for col in dca_df.columns]
+        # 일시투자와 적립투자 데이터 병합 (원본 복사 없이 컬럼명만 변경)
+        lump_sum_df = comparison_result['lump_sum']['daily_returns'].rename(
+            columns=lambda col: col if col == 'date' else f'일시투자_{col}', copy=False)
+        dca_df = comparison_result['dca']['daily_returns'].rename(
+            columns=lambda col: col if col == 'date' else f'적립투자_{col}', copy=False)
         
         # 날짜 기준으로 병합
-        merged_df = pd.merge(lump_sum_df, dca_df, on='date', how='outer').sort_values('date')
+        if lump_sum_df['date'].equals(dca_df['date']):
+            # 거래일이 동일한 경우(일반적인 경우) 해시 병합/정렬 없이 열 방향으로 결합
+            merged_df = pd.concat([
+                lump_sum_df.reset_index(drop=True),
+                dca_df.drop(columns='date').reset_index(drop=True)
+            ], axis=1)
+        else:
+            # 거래일이 다른 경우 날짜 인덱스 기준 외부 결합
+            merged_df = pd.concat(
+                [lump_sum_df.set_index('date'), dca_df.set_index('date')], axis=1
+            ).sort_index().reset_index()
         
         # 컬럼 순서 정리
         columns_order = [
@@ -151,20 +218,21 @@ class ExcelExporter:
         
         merged_df.rename(columns=column_mapping, inplace=True)
         
-        # 데이터프레임을 시트에 입력
-        for r in dataframe_to_rows(merged_df, index=False, header=True):
-            ws.append(r)
-        
-        # 셀 서식 적용
-        self._apply_cell_formatting(ws)
+        # 컬럼별로 값 목록을 한 번씩 꺼내 행 목록 구성 (행 단위 DataFrame 순회 없이) 후 셀 서식 적용하여 기록
+        rows = [list(merged_df.columns)]
+        rows.extend(map(list, zip(*(column.tolist() for _, column in merged_df.items()))))
+        self._append_formatted_rows(ws, rows)
     
-    def _create_analysis_summary_sheet(self, comparison_result: Dict[str, Any], analyzer):
+    def _create_analysis_summary_sheet(self, comparison_result: Dict[str, Any], analyzer,
+                                       metrics: Dict[str, Dict[str, Any]] = None):
         """분석 요약 시트 생성"""
         ws = self.workbook.create_sheet("분석 요약")
         
-        # 지표 계산
-        lump_sum_metrics = analyzer.calculate_metrics(comparison_result['lump_sum'])
-        dca_metrics = analyzer.calculate_metrics(comparison_result['dca'])
+        # 지표 계산 (이미 계산된 지표가 없을 때만)
+        if metrics is None:
+            metrics = analyzer.calculate_comparison_metrics(comparison_result)
+        lump_sum_metrics = metrics['lump_sum']
+        dca_metrics = metrics['dca']
         
         # 요약 테이블 생성 (순수 숫자 값으로 저장)
         summary_data = [
@@ -189,158 +257,158 @@ class ExcelExporter:
              lump_sum_metrics['final_value'] - dca_metrics['final_value']]
         ]
         
-        # 데이터 입력
-        for row_data in summary_data:
-            ws.append(row_data)
-        
         # 투자 설정 정보 추가
-        ws.append([])
-        ws.append(['[ 투자 설정 정보 ]'])
-        ws.append(['지수', self.config.symbol])
-        ws.append(['투자 시작', f"{self.config.start_year}년 {self.config.start_month}월"])
-        ws.append(['투자 기간', f"{self.config.investment_period_years}년"])
-        ws.append(['적립 분할 월수', f"{self.config.dca_months}개월"])
-        ws.append(['총 투자금', f"{self.config.initial_capital:,}"])
-        ws.append(['월 적립금', f"{self.config.get_dca_monthly_amount():,.0f}"])
-        
-        # 셀 서식 적용
-        self._apply_cell_formatting(ws)
+        summary_data.extend([
+            [],
+            ['[ 투자 설정 정보 ]'],
+            ['지수', self.config.symbol],
+            ['투자 시작', f"{self.config.start_year}년 {self.config.start_month}월"],
+            ['투자 기간', f"{self.config.investment_period_years}년"],
+            ['적립 분할 월수', f"{self.config.dca_months}개월"],
+            ['총 투자금', f"{self.config.initial_capital:,}"],
+            ['월 적립금', f"{self.config.get_dca_monthly_amount():,.0f}"],
+        ])
+        
+        # 셀 서식 적용 후 기록
+        self._append_formatted_rows(ws, summary_data)
     
-    def _apply_cell_formatting(self, ws):
-        """셀 서식 적용"""
+    def _append_formatted_rows(self, ws, rows: list):
+        """셀 서식을 적용하여 행 기록 (write-only 시트는 기록 후 수정할 수 없으므로 기록 시점에 적용)
+        
+        첫 번째 행(헤더)이 컬럼 수를 결정하며, 이후 행은 헤더보다 길지 않아야 함
+        """
+        headers = list(rows[0])
+        max_column = len(headers)
+        row_labels = [row[0] if row else None for row in rows]
+        
         # 머리행 고정
         ws.freeze_panes = 'A2'
         
-        # 색상 정의
-        common_color = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")  # 연한 회색
-        lump_sum_color = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")  # 연한 파란색
-        dca_color = PatternFill(start_color="F0FFF0", end_color="F0FFF0", fill_type="solid")  # 연한 초록색
-        
-        # 테두리 정의
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # 열 너비 조정 및 컬럼별 색상 적용
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            header_value = str(column[0].value) if column[0].value else ""
-            
-            # 컬럼 유형별 색상 결정
-            if any(keyword in header_value for keyword in ['날짜', '종가', '구분', '매수일', '매수가격']):
-                column_color = common_color
-            elif '일시투자' in header_value:
-                column_color = lump_sum_color
-            elif '적립투자' in header_value:
-                column_color = dca_color
-            else:
-                column_color = common_color
+        # 컬럼별 서식 테이블 사전 계산: (색상, 서식 유형, 숫자 서식)
+        # 헤더 키워드 검사를 셀마다 반복하지 않고 컬럼당 한 번만 수행
+        col_fmt = [_classify_header(header) for header in headers]
+        
+        # 요약 시트 지표 행(첫 번째 열 라벨)별 숫자 서식 사전 계산
+        row_label_fmt = [_classify_row_label(label) for label in row_labels]
+        
+        # 컬럼별 최대 표시 길이
+        # 고정 숫자 서식 컬럼은 헤더와 서식으로 추정하고, 날짜 컬럼은 첫 데이터 값으로 추정
+        # 나머지(텍스트 등) 컬럼만 서식 적용과 같은 순회에서 셀 길이를 누적
+        max_lengths = [0] * max_column
+        scan_columns = [True] * max_column
+        first_row = rows[1] if len(rows) > 1 else []
+        for col_idx, (header, (fill, col_kind, num_fmt)) in enumerate(zip(headers, col_fmt)):
+            header_length = _display_length(header) if header is not None else 0
+            if num_fmt in _FORMAT_WIDTH_HINTS:
+                max_lengths[col_idx] = max(header_length, _FORMAT_WIDTH_HINTS[num_fmt])
+                scan_columns[col_idx] = False
+            elif col_kind == 'date' and col_idx < len(first_row) and first_row[col_idx] is not None:
+                max_lengths[col_idx] = max(header_length, _display_length(first_row[col_idx]))
+                scan_columns[col_idx] = False
+        
+        # 데이터 타입별 서식 적용 및 길이 계산 (단일 순회)
+        styled_rows = []
+        style_cache = {}
+        padding = [None] * max_column
+        for row_idx, row in enumerate(rows, 1):
+            label_fmt = row_label_fmt[row_idx - 1]
+            is_final_value_row = row_idx > 1 and row_labels[row_idx - 1] == '최종 가치'
+            styled_row = []
             
-            # 해당 컬럼의 모든 셀에 색상 및 테두리 적용
-            for cell in column:
-                cell.fill = column_color
-                cell.border = thin_border
+            # 짧은 행은 빈 셀로 채워 컬럼별 서식 배열과 나란히 순회 (col_idx는 0부터)
+            values = list(row) + padding[len(row):]
+            for col_idx, value, (fill, col_kind, num_fmt), scan in zip(
+                    range(max_column), values, col_fmt, scan_columns):
+                
+                # 길이 계산 (실제 표시될 텍스트 길이 고려)
+                if value is not None and scan:
+                    text_length = _display_length(value)
+                    if text_length > max_lengths[col_idx]:
+                        max_lengths[col_idx] = text_length
                 
                 # 첫 번째 행(헤더)은 볼드체 및 가운데 정렬 적용
-                if cell.row == 1:
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal="center")
+                font = _BOLD if row_idx == 1 else None
+                alignment = _CENTER if row_idx == 1 else None
+                number_format = None
                 
-                # 길이 계산 (실제 표시될 텍스트 길이 고려)
-                try:
-                    cell_text = str(cell.value) if cell.value is not None else ""
-                    # 한글은 2배 가중치 적용
-                    text_length = sum(2 if ord(c) > 127 else 1 for c in cell_text)
-                    if text_length > max_length:
-                        max_length = text_length
-                except:
+                if value is None:
                     pass
-            
-            # 데이터에 맞는 최적 너비 설정 (최소 8, 최대 25)
-            optimal_width = max(8, min(max_length + 2, 25))
-            ws.column_dimensions[column_letter].width = optimal_width
-        
-        # 데이터 타입별 서식 적용
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.value is None:
-                    continue
-                
-                # 숫자 타입 확인 함수 (numpy 타입 포함)
-                def is_numeric(value):
-                    try:
-                        float(value)
-                        return True
-                    except (ValueError, TypeError):
-                        return False
                 
-                # 최종 가치 행 우선 처리 (금액 형식)  
-                if cell.row > 1 and ws.cell(cell.row, 1).value == '최종 가치':
-                    if is_numeric(cell.value) and cell.column > 1:
-                        cell.number_format = "#,##0"
-                        cell.alignment = Alignment(horizontal="right")
-                        continue  # 다른 조건들 건너뛰기
+                # 최종 가치 행 우선 처리 (다른 조건들 건너뛰기)
+                elif is_final_value_row:
+                    if _is_numeric(value) and col_idx > 0:
+                        number_format = label_fmt
+                        alignment = _RIGHT
                 
                 # 날짜 형식
-                elif '날짜' in str(ws.cell(1, cell.column).value) or 'date' in str(ws.cell(1, cell.column).value):
-                    cell.alignment = Alignment(horizontal="center")
+                elif col_kind == 'date':
+                    alignment = _CENTER
                 
                 # 수익률 형식
-                elif '수익률' in str(ws.cell(1, cell.column).value) or 'return' in str(ws.cell(1, cell.column).value):
-                    if is_numeric(cell.value) and cell.row > 1:
-                        cell.number_format = FORMAT_PERCENTAGE_00
-                        cell.alignment = Alignment(horizontal="right")
-                
-                # 샤프 지수 형식 (소수점 2자리)
-                elif '샤프 지수' in str(ws.cell(cell.row, 1).value):
-                    if is_numeric(cell.value) and cell.column > 1:
-                        cell.number_format = "0.00"
-                        cell.alignment = Alignment(horizontal="right")
+                elif col_kind == 'return':
+                    if _is_numeric(value) and row_idx > 1:
+                        number_format = num_fmt
+                        alignment = _RIGHT
                 
-                # 퍼센트 지표 형식 (CAGR, MDD, 변동성, 최종 수익률)
-                elif any(keyword in str(ws.cell(cell.row, 1).value) for keyword in ['CAGR', 'MDD', '변동성', '최종 수익률']):
-                    if is_numeric(cell.value) and cell.column > 1:
-                        cell.number_format = FORMAT_PERCENTAGE_00
-                        cell.alignment = Alignment(horizontal="right")
+                # 지표 행 형식 (샤프 지수, CAGR, MDD, 변동성, 최종 수익률)
+                elif label_fmt:
+                    if _is_numeric(value) and col_idx > 0:
+                        number_format = label_fmt
+                        alignment = _RIGHT
                 
-                # 금액 형식 (소수점 없음)
-                elif any(keyword in str(ws.cell(1, cell.column).value) for keyword in ['금액', '가치', '가격', 'amount', 'value', 'price']):
-                    if is_numeric(cell.value) and cell.row > 1:
-                        cell.number_format = "#,##0"
-                        cell.alignment = Alignment(horizontal="right")
+                # 금액/수량/손실폭 컬럼 형식
+                elif col_kind == 'number':
+                    if _is_numeric(value) and row_idx > 1:
+                        number_format = num_fmt
+                        alignment = _RIGHT
                 
-                # 수량 및 평단가 형식 (소수점 2자리)
-                elif any(keyword in str(ws.cell(1, cell.column).value) for keyword in ['수량', '평균단가', 'shares', 'average_price']):
-                    if is_numeric(cell.value) and cell.row > 1:
-                        cell.number_format = "#,##0.00"
-                        cell.alignment = Alignment(horizontal="right")
+                # 일반 숫자 형식 (헤더 제외 모든 숫자 데이터 오른쪽 정렬)
+                elif _is_numeric(value) and row_idx > 1:
+                    alignment = _RIGHT
                 
-                # 손실폭 형식 (소수점 2자리 퍼센트)
-                elif '고점대비손실폭' in str(ws.cell(1, cell.column).value):
-                    if is_numeric(cell.value) and cell.row > 1:
-                        cell.number_format = "0.00%"
-                        cell.alignment = Alignment(horizontal="right")
-                
-                # 일반 숫자 형식
-                elif is_numeric(cell.value) and cell.row > 1:
-                    cell.alignment = Alignment(horizontal="right")
-                
-                # 모든 숫자 데이터 오른쪽 정렬 (헤더 제외) - 이미 위에서 처리되지 않은 경우
-                elif cell.row > 1 and is_numeric(cell.value):
-                    cell.alignment = Alignment(horizontal="right")
+                # 모든 셀에 컬럼 색상 및 테두리 적용
+                # 같은 서식 조합은 처음 한 번만 워크북에 스타일을 등록하고 이후에는 스타일 ID만 복사
+                cell = WriteOnlyCell(ws, value=value)
+                style_key = (col_idx, font is not None, id(alignment), number_format)
+                style = style_cache.get(style_key)
+                if style is None:
+                    cell.fill = fill
+                    cell.border = _THIN_BORDER
+                    if font is not None:
+                        cell.font = font
+                    if alignment is not None:
+                        cell.alignment = alignment
+                    if number_format is not None:
+                        cell.number_format = number_format
+                    style_cache[style_key] = cell._style
+                else:
+                    cell._style = copy(style)
+                styled_row.append(cell)
+            
+            styled_rows.append(styled_row)
+        
+        # 데이터에 맞는 최적 너비 설정 (최소 8, 최대 25, write-only 시트는 행 기록 전에 설정해야 함)
+        for col_idx, max_length in enumerate(max_lengths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = max(8, min(max_length + 2, 25))
+        
+        for styled_row in styled_rows:
+            ws.append(styled_row)
     
     def _create_backtest_settings_sheet(self):
         """백테스트 설정 시트 생성"""
         ws = self.workbook.create_sheet("백테스트 설정")
         
+        # 열 너비 조정 및 머리행 고정 (write-only 시트는 행 기록 전에 설정)
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 30
+        ws.freeze_panes = 'A2'
+        
         # 제목 설정
-        ws.cell(row=1, column=1, value="백테스트 설정 정보")
-        ws.cell(row=1, column=1).font = Font(bold=True, size=14)
-        ws.cell(row=1, column=1).alignment = Alignment(horizontal="left")
+        title_cell = WriteOnlyCell(ws, value="백테스트 설정 정보")
+        title_cell.font = _TITLE_FONT
+        title_cell.alignment = _LEFT
+        ws.append([title_cell])
+        ws.append([])
         
         # 설정 정보 추가
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -357,24 +425,18 @@ class ExcelExporter:
             ["월 적립금", f"{self.config.get_dca_monthly_amount():,.0f}원"],
         ]
         
-        # 데이터 입력
-        for row_idx, (key, value) in enumerate(settings_data, start=3):
+        # 데이터 입력 (3행부터)
+        for key, value in settings_data:
+            row = []
             if key:  # 키가 있는 경우
-                ws.cell(row=row_idx, column=1, value=key)
-                ws.cell(row=row_idx, column=1).font = Font(bold=True)
-                ws.cell(row=row_idx, column=1).alignment = Alignment(horizontal="left")
+                key_cell = WriteOnlyCell(ws, value=key)
+                key_cell.font = _BOLD
+                key_cell.alignment = _LEFT
+                row.append(key_cell)
                 
                 if value:  # 값이 있는 경우
-                    ws.cell(row=row_idx, column=2, value=value)
-                    ws.cell(row=row_idx, column=2).alignment = Alignment(horizontal="left")
-                    
-                    # 섹션 제목 스타일링
-                    if not value and key in ["투자 설정"]:
-                        ws.cell(row=row_idx, column=1).fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-        
-        # 열 너비 조정
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 30
-        
-        # 머리행 고정
-        ws.freeze_panes = 'A2'
\ No newline at end of file
+                    value_cell = WriteOnlyCell(ws, value=value)
+                    value_cell.alignment = _LEFT
+                    row.append(value_cell)
+            
+            ws.append(row)
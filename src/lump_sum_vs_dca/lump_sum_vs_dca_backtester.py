@@ -20,10 +20,11 @@ from strategy_factory import LumpSumVsDcaStrategyFactory
 class LumpSumVsDcaBacktester(BaseBacktester):
     """일시투자 vs 적립투자 전용 백테스터"""
     
-    def run_backtest(self, symbol: str, strategy_type: str) -> Dict[str, Any]:
-        """백테스팅 실행"""
+    def run_backtest(self, symbol: str, strategy_type: str, data: pd.DataFrame = None) -> Dict[str, Any]:
+        """백테스팅 실행 (data를 전달하면 재사용, 없으면 로드)"""
         # 데이터 로드
-        data = self.load_data(symbol)
+        if data is None:
+            data = self.load_data(symbol)
         
         # 전략 생성 및 실행
         strategy = LumpSumVsDcaStrategyFactory.create_strategy(strategy_type, self.config)
@@ -52,10 +53,13 @@ class LumpSumVsDcaBacktester(BaseBacktester):
         
         return result
     
-    def run_comparison(self, symbol: str) -> Dict[str, Any]:
-        """일시투자 vs 적립투자 비교 분석"""
-        lump_sum_result = self.run_backtest(symbol, 'lump_sum')
-        dca_result = self.run_backtest(symbol, 'dca')
+    def run_comparison(self, symbol: str, data: pd.DataFrame = None) -> Dict[str, Any]:
+        """일시투자 vs 적립투자 비교 분석 (data를 전달하면 재사용, 없으면 로드)"""
+        # 데이터는 한 번만 로드하여 두 전략에서 공유
+        if data is None:
+            data = self.load_data(symbol)
+        lump_sum_result = self.run_backtest(symbol, 'lump_sum', data)
+        dca_result = self.run_backtest(symbol, 'dca', data)
         
         return {
             'lump_sum': lump_sum_result,
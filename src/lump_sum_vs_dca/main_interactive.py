@@ -116,13 +116,14 @@ def main():
         
         # 결과 요약 출력
         print(f"\n[3] 결과 요약:")
-        summary = analyzer.generate_summary(comparison_result)
+        metrics = analyzer.calculate_comparison_metrics(comparison_result)
+        summary = analyzer.generate_summary(comparison_result, metrics)
         print(summary)
         
         # Excel 출력
         print(f"[4] Excel 파일 생성 중...")
         exporter = ExcelExporter(config)
-        excel_file = exporter.export_analysis(comparison_result, analyzer)
+        excel_file = exporter.export_analysis(comparison_result, analyzer, metrics)
         
         print(f"\n분석 완료!")
         print(f"결과 파일: {excel_file}")
@@ -1,27 +1,88 @@
 """
 롤링 백테스트 인사이트 차트 생성 모듈
 """
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # 파일 출력 전용 (GUI 백엔드 불필요)
+import matplotlib.style
 import matplotlib.font_manager as fm
 import matplotlib.dates as mdates
+from matplotlib.ticker import PercentFormatter
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
-import seaborn as sns
 import os
 from typing import List, Dict, Any
 from datetime import datetime
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
 import warnings
-warnings.filterwarnings('ignore')
 
-# 스타일 설정
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+# 한글 폰트가 없는 환경의 글리프 누락 경고만 무시 (그 외 경고는 그대로 표시)
+warnings.filterwarnings('ignore', message=r'Glyph .* missing from', category=UserWarning)
+
+
+@lru_cache(maxsize=1)
+def _resolve_korean_font():
+    """한글 폰트 이름 탐색 (결과를 캐시하여 폰트 목록을 한 번만 검색)
+    
+    Returns:
+        (폰트 이름, 폰트 목록에서 찾았는지 여부) - 찾지 못하면 (None, False)
+    """
+    # 한글 폰트 찾기
+    korean_fonts = [f.name for f in fm.fontManager.ttflist if 'CJK' in f.name or 'Nanum' in f.name]
+    if korean_fonts:
+        return korean_fonts[0], True
+    
+    # 대체 폰트 설정
+    font_path = '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'
+    if os.path.exists(font_path):
+        return fm.FontProperties(fname=font_path).get_name(), False
+    
+    return None, False
+
+
+def _yearly_mean(years: np.ndarray, values: np.ndarray):
+    """연도별 평균 계산 (np.bincount 사용)
+    
+    Returns:
+        (데이터가 있는 연도, 연도별 평균, 연도별 표본 수)
+    """
+    if len(years) == 0:
+        return years, np.array([], dtype=np.float64), np.array([], dtype=np.int64)
+    
+    first_year = years.min()
+    offsets = years - first_year
+    counts = np.bincount(offsets)
+    sums = np.bincount(offsets, weights=values)
+    present = counts > 0
+    
+    year_labels = np.arange(first_year, first_year + len(counts))[present]
+    return year_labels, sums[present] / counts[present], counts[present]
+
+
+def _render_chart(generator: 'RollingChartGenerator', method_name: str, df: pd.DataFrame) -> str:
+    """워커 프로세스에서 차트 1개 생성 (폰트 설정은 프로세스마다 적용)"""
+    generator._setup_korean_fonts()
+    return getattr(generator, method_name)(df)
 
 
 class RollingChartGenerator:
     """롤링 백테스트 인사이트 차트 생성기"""
     
+    # 스타일/한글 폰트/차트 품질 rcParams 적용 여부 (프로세스당 한 번)
+    _fonts_configured = False
+    
+    # 날짜 축 포맷터/로케이터 (차트는 하나씩 그려 저장하므로 인스턴스를 공유)
+    _YM_FMT = mdates.DateFormatter('%Y-%m')
+    _YR_LOC_1 = mdates.YearLocator(1)
+    _YR_LOC_2 = mdates.YearLocator(2)
+    
+    # 대시보드 통계 테이블 헤더
+    _STATS_TABLE_HEADER = ('지표', '일시투자', '적립투자', '차이', '일시투자 우위율')
+    
     def __init__(self, symbol: str, start_year: int, end_year: int, 
                  investment_period_years: int, dca_months: int, chart_dir=None):
         self.symbol = symbol
@@ -31,6 +92,9 @@ class RollingChartGenerator:
         self.dca_months = dca_months
         self._setup_korean_fonts()
         
+        # 타임스탬프 파일명 접미사 (생성기 단위로 한 번만 계산하여 모든 차트가 공유)
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         # 차트 저장 디렉토리 설정 (외부에서 지정 가능)
         if chart_dir:
             self.chart_dir = Path(chart_dir)
@@ -41,89 +105,220 @@ class RollingChartGenerator:
             self.chart_dir = project_root / "results" / "lump_sum_vs_dca" / "charts"
         
         self.chart_dir.mkdir(parents=True, exist_ok=True)
+        
+        # 같은 크기의 차트끼리 재사용하는 Figure 풀 (figsize -> Figure)
+        self._figures = {}
+        
+        # 차트 공통 요약 통계 캐시 (계산에 사용한 DataFrame, 통계)
+        self._stats_cache = None
     
-    def _setup_korean_fonts(self):
-        """한글 폰트 설정"""
-        # 폰트 캐시 클리어 및 시스템 폰트 재로드
-        fm._get_fontconfig_fonts.cache_clear()
-        fm.fontManager.__init__()
-        
-        # 한글 폰트 찾기 및 설정
-        korean_fonts = [f.name for f in fm.fontManager.ttflist if 'CJK' in f.name or 'Nanum' in f.name]
-        if korean_fonts:
-            font_name = korean_fonts[0]
-            plt.rcParams['font.family'] = font_name
-            plt.rcParams['font.sans-serif'] = [font_name] + plt.rcParams['font.sans-serif']
-            plt.rcParams['font.monospace'] = [font_name] + plt.rcParams['font.monospace']
-            plt.rcParams['font.serif'] = [font_name] + plt.rcParams['font.serif']
+    def __getstate__(self):
+        """워커 프로세스로 전달할 때 Figure 풀은 제외"""
+        state = self.__dict__.copy()
+        state['_figures'] = {}
+        state['_stats_cache'] = None
+        return state
+    
+    def _get_figure(self, figsize: tuple) -> Figure:
+        """figsize별로 재사용하는 Figure 반환 (이전 차트 내용은 비움)"""
+        fig = self._figures.get(figsize)
+        if fig is None:
+            fig = Figure(figsize=figsize, layout='constrained')
+            self._figures[figsize] = fig
         else:
-            # 대체 폰트 설정
-            font_path = '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'
-            if os.path.exists(font_path):
-                prop = fm.FontProperties(fname=font_path)
-                font_name = prop.get_name()
-                plt.rcParams['font.family'] = font_name
-                plt.rcParams['font.sans-serif'] = [font_name] + plt.rcParams['font.sans-serif']
-        
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 차트 품질 설정
-        plt.rcParams['figure.dpi'] = 300
-        plt.rcParams['savefig.dpi'] = 300
-        plt.rcParams['savefig.bbox'] = 'tight'
+            fig.clear()
+        return fig
+    
+    def _get_summary_stats(self, df: pd.DataFrame) -> Dict[str, float]:
+        """수치 컬럼 평균 등 여러 차트가 공유하는 요약 통계 (같은 DataFrame이면 재사용)"""
+        if self._stats_cache is not None and self._stats_cache[0] is df:
+            return self._stats_cache[1]
+        
+        stats = df.select_dtypes('number').mean().to_dict()
+        stats['sharpe_win_rate'] = float((df['lump_sum_sharpe'].to_numpy() > df['dca_sharpe'].to_numpy()).mean())
+        self._stats_cache = (df, stats)
+        return stats
     
-    def generate_all_charts(self, results: List[Dict[str, Any]]) -> Dict[str, str]:
-        """핵심 인사이트 차트 3개 생성 (선별)"""
+    def close_figures(self):
+        """재사용 중인 Figure 풀 해제"""
+        for fig in self._figures.values():
+            fig.clear()
+        self._figures.clear()
+    
+    def _setup_korean_fonts(self):
+        """차트 스타일 및 한글 폰트 설정 (모듈 import 시가 아닌 첫 사용 시, 프로세스당 한 번만 적용)"""
+        if RollingChartGenerator._fonts_configured:
+            return
+        
+        # 스타일 설정 (폰트 설정보다 먼저 적용해야 폰트가 덮어써지지 않음)
+        matplotlib.style.use('seaborn-v0_8-whitegrid')
+        
+        font_name, found_in_font_list = _resolve_korean_font()
+        if font_name:
+            matplotlib.rcParams['font.family'] = font_name
+            matplotlib.rcParams['font.sans-serif'] = [font_name] + matplotlib.rcParams['font.sans-serif']
+            if found_in_font_list:
+                matplotlib.rcParams['font.monospace'] = [font_name] + matplotlib.rcParams['font.monospace']
+                matplotlib.rcParams['font.serif'] = [font_name] + matplotlib.rcParams['font.serif']
+        
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        
+        # 차트 품질 설정 (파일 출력 전용이므로 150dpi, 레이아웃은 그림별 constrained 엔진 사용)
+        matplotlib.rcParams['figure.dpi'] = 150
+        matplotlib.rcParams['savefig.dpi'] = 150
+        
+        RollingChartGenerator._fonts_configured = True
+    
+    def _get_timestamped_filepath(self, chart_name: str) -> Path:
+        """타임스탬프 접미사 차트 파일 경로 반환 (중복 시 번호 추가)"""
+        base_name = f'{chart_name}_{self.symbol}_{self.start_year}_{self.end_year}_{self.timestamp}'
+        filepath = self.chart_dir / f'{base_name}.png'
+        
+        counter = 1
+        while filepath.exists():
+            filepath = self.chart_dir / f'{base_name}({counter}).png'
+            counter += 1
+        return filepath
+    
+    def generate_all_charts(self, results, parallel: bool = True) -> Dict[str, str]:
+        """핵심 인사이트 차트 3개 생성 (선별, parallel=True면 프로세스 병렬 생성)
+        
+        results는 롤링 결과 리스트 또는 결과 DataFrame
+        """
         chart_files = {}
         
         print("📊 핵심 인사이트 차트 생성 중...")
         
-        # 데이터프레임 변환
-        df = pd.DataFrame(results)
-        df['date'] = pd.to_datetime(df['period'])
-        df['win'] = (df['return_difference'] > 0).astype(int)
+        # 데이터프레임 변환 (파생 컬럼 포함)
+        df = self.prepare_dataframe(results)
+        self._get_summary_stats(df)
         
         # 🎯 가장 인사이트가 있는 핵심 차트 3개 생성
-        print("  [1/3] 수익률 시계열 비교 (투자 시점별 수익률 추이)...")
-        chart_files['return_timeline'] = self.create_return_timeline_chart(df)
-        
-        print("  [2/3] 성과 차이 히트맵 (시기별 패턴 분석)...")
-        chart_files['performance_heatmap'] = self.create_performance_heatmap_chart(df)
+        chart_tasks = [
+            ('return_timeline', 'create_return_timeline_chart',
+             "  [1/3] 수익률 시계열 비교 (투자 시점별 수익률 추이)..."),
+            ('performance_heatmap', 'create_performance_heatmap_chart',
+             "  [2/3] 성과 차이 히트맵 (시기별 패턴 분석)..."),
+            ('summary_dashboard', 'create_summary_dashboard_chart',
+             "  [3/3] 통계 요약 대시보드 (종합 분석)..."),
+        ]
         
-        print("  [3/3] 통계 요약 대시보드 (종합 분석)...")
-        chart_files['summary_dashboard'] = self.create_summary_dashboard_chart(df)
+        # 단일 코어 환경에서는 프로세스 생성 비용만 늘어나므로 순차 생성
+        if parallel and (os.cpu_count() or 1) > 1:
+            # 차트별로 독립적이므로 프로세스별 병렬 렌더링
+            try:
+                with ProcessPoolExecutor(max_workers=len(chart_tasks)) as executor:
+                    futures = {key: executor.submit(_render_chart, self, method_name, df)
+                               for key, method_name, _ in chart_tasks}
+                    for key, _, message in chart_tasks:
+                        print(message)
+                        chart_files[key] = futures[key].result()
+            except (OSError, BrokenProcessPool, PicklingError, TypeError, AttributeError) as e:
+                # 피클링 실패는 TypeError/AttributeError로도 전달됨
+                print(f"⚠️ 병렬 차트 생성 실패, 순차 생성으로 전환: {e}")
+                chart_files = {}
+        
+        if not chart_files:
+            for key, method_name, message in chart_tasks:
+                print(message)
+                chart_files[key] = getattr(self, method_name)(df)
+            self.close_figures()
         
         print("📊 핵심 인사이트 차트 생성 완료!")
         return chart_files
     
+    def _get_fixed_filepath(self, chart_name: str) -> Path:
+        """고정 이름(타임스탬프 없음) 차트 파일 경로 반환"""
+        return self.chart_dir / f'{chart_name}_{self.symbol}_{self.start_year}_{self.end_year}.png'
+    
+    @staticmethod
+    def results_to_dataframe(results: List[Dict[str, Any]]) -> pd.DataFrame:
+        """롤링 결과 리스트를 컬럼 단위로 DataFrame 변환 (첫 결과의 값 타입으로 dtype 지정)
+        
+        문자열은 object, 정수는 int64, 나머지는 float64 컬럼으로 생성
+        """
+        if not results:
+            return pd.DataFrame()
+        
+        count = len(results)
+        columns = {}
+        try:
+            for key, sample in results[0].items():
+                if isinstance(sample, str):
+                    columns[key] = [r[key] for r in results]
+                else:
+                    dtype = np.int64 if isinstance(sample, (int, np.integer)) and not isinstance(sample, bool) else np.float64
+                    columns[key] = np.fromiter((r[key] for r in results), dtype=dtype, count=count)
+        except (KeyError, TypeError, ValueError):
+            # 결과마다 키/타입이 다르면 일반 생성자로 처리
+            return pd.DataFrame(results)
+        
+        return pd.DataFrame(columns)
+    
+    @staticmethod
+    def prepare_dataframe(results) -> pd.DataFrame:
+        """차트 공통 데이터프레임 생성 (날짜순 정렬 및 차트별 파생 컬럼을 한 번만 계산)
+        
+        results는 롤링 결과 리스트 또는 results_to_dataframe으로 만든 DataFrame (원본은 변경하지 않음)
+        create_*_chart 메서드는 이 함수로 준비된 데이터프레임을 입력으로 받음
+        """
+        if isinstance(results, pd.DataFrame):
+            df = results.copy()
+        else:
+            df = RollingChartGenerator.results_to_dataframe(results)
+        df['date'] = pd.to_datetime(df['period'])
+        df.sort_values('date', inplace=True, kind='mergesort')
+        df.reset_index(drop=True, inplace=True)
+        
+        # 날짜 파생 컬럼
+        df['year'] = df['date'].dt.year.to_numpy()
+        df['month'] = df['date'].dt.month.to_numpy()
+        df['win'] = (df['return_difference'] > 0).astype(int)
+        
+        # 퍼센트 변환 컬럼 (그리기 전용 컬럼은 float32로 축소)
+        # MDD 구간 경계와 히트맵 평균 값이 바뀌지 않도록 MDD/수익률 차이는 float64 유지
+        for column, source in (('lump_sum_return_pct', 'lump_sum_return'),
+                               ('dca_return_pct', 'dca_return'),
+                               ('lump_sum_cagr_pct', 'lump_sum_cagr'),
+                               ('dca_cagr_pct', 'dca_cagr'),
+                               ('lump_sum_vol_pct', 'lump_sum_volatility'),
+                               ('dca_vol_pct', 'dca_volatility')):
+            df[column] = (df[source].to_numpy() * 100).astype(np.float32)
+        df['return_diff_pct'] = df['return_difference'].to_numpy() * 100
+        df['lump_sum_mdd_pct'] = df['lump_sum_mdd'].to_numpy() * 100
+        df['dca_mdd_pct'] = df['dca_mdd'].to_numpy() * 100
+        
+        return df
+    
     def create_return_timeline_chart(self, df: pd.DataFrame) -> str:
         """수익률 시계열 비교 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
-        
-        # 시간순 정렬
-        df_sorted = df.sort_values('date')
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
-        # 수익률을 퍼센트로 변환
-        lump_sum_returns = df_sorted['lump_sum_return'] * 100
-        dca_returns = df_sorted['dca_return'] * 100
+        # 퍼센트 수익률 (그리기용 배열과 우위 마스크는 한 번만 생성하여 공유)
+        dates = df['date'].to_numpy()
+        lump_sum_returns = df['lump_sum_return_pct'].to_numpy()
+        dca_returns = df['dca_return_pct'].to_numpy()
+        lump_sum_wins = lump_sum_returns > dca_returns
+        stats = self._get_summary_stats(df)
         
         # 라인 차트 그리기
-        ax.plot(df_sorted['date'], lump_sum_returns, 
+        ax.plot(dates, lump_sum_returns, 
                linewidth=3, color='#1f77b4', marker='o', markersize=4,
-               label=f'일시투자 (평균: {lump_sum_returns.mean():.1f}%)', alpha=0.8)
-        ax.plot(df_sorted['date'], dca_returns, 
+               label=f'일시투자 (평균: {stats["lump_sum_return_pct"]:.1f}%)', alpha=0.8)
+        ax.plot(dates, dca_returns, 
                linewidth=3, color='#ff7f0e', marker='s', markersize=4,
-               label=f'적립투자 (평균: {dca_returns.mean():.1f}%)', alpha=0.8)
+               label=f'적립투자 (평균: {stats["dca_return_pct"]:.1f}%)', alpha=0.8)
         
         # 0% 기준선
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.7, linewidth=2, label='손익분기점 (0%)')
         
         # 우위 영역 표시
-        ax.fill_between(df_sorted['date'], lump_sum_returns, dca_returns,
-                       where=(lump_sum_returns > dca_returns),
+        ax.fill_between(dates, lump_sum_returns, dca_returns,
+                       where=lump_sum_wins,
                        color='blue', alpha=0.1, interpolate=True, label='일시투자 우위 구간')
-        ax.fill_between(df_sorted['date'], lump_sum_returns, dca_returns,
-                       where=(lump_sum_returns <= dca_returns),
+        ax.fill_between(dates, lump_sum_returns, dca_returns,
+                       where=~lump_sum_wins,
                        color='orange', alpha=0.1, interpolate=True, label='적립투자 우위 구간')
         
         # 차트 설정
@@ -135,45 +330,35 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # X축 날짜 포맷
-        import matplotlib.dates as mdates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.YearLocator(2))  # 2년 간격
-        plt.xticks(rotation=45)
+        ax.xaxis.set_major_formatter(self._YM_FMT)
+        ax.xaxis.set_major_locator(self._YR_LOC_2)  # 2년 간격
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Y축 포맷 (% 표시)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.0f}%'))
+        ax.yaxis.set_major_formatter(PercentFormatter(xmax=100, decimals=0))
         
         # 승률 정보 텍스트 박스
-        win_rate = (df['return_difference'] > 0).mean()
-        avg_diff = df['return_difference'].mean() * 100
+        win_rate = stats['win']
+        avg_diff = stats['return_difference'] * 100
         
-        stats_text = f'전략 비교 요약\n일시투자 승률: {win_rate:.1%}\n평균 수익률 차이: {avg_diff:.1f}%p\n(일시투자 - 적립투자)'
+        stats_text = f'전략 비교 요약\n일시투자 승률: {win_rate*100:.1f}%\n평균 수익률 차이: {avg_diff:.1f}%p\n(일시투자 - 적립투자)'
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f'롤링_수익률시계열_{self.symbol}_{self.start_year}_{self.end_year}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_fixed_filepath('롤링_수익률시계열')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_win_rate_trend_chart(self, df: pd.DataFrame) -> str:
         """1. 승률 트렌드 차트"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
         # 연도별 승률 계산
-        df['year'] = df['date'].dt.year
-        yearly_stats = df.groupby('year').agg({
-            'win': ['mean', 'count'],
-            'return_difference': 'mean'
-        }).round(4)
-        
-        years = yearly_stats.index
-        win_rates = yearly_stats[('win', 'mean')] * 100
-        sample_counts = yearly_stats[('win', 'count')]
+        years, yearly_win, sample_counts = _yearly_mean(
+            df['year'].to_numpy(), df['win'].to_numpy(np.float64))
+        win_rates = yearly_win.round(4) * 100
         
         # 승률 트렌드 라인
         ax.plot(years, win_rates, marker='o', linewidth=3, markersize=8, 
@@ -196,32 +381,32 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3)
         ax.set_ylim(0, 100)
         
-        plt.tight_layout()
-        
-        filename = f'롤링_승률트렌드_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_승률트렌드')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_return_distribution_chart(self, df: pd.DataFrame) -> str:
         """2. 수익률 분포 히스토그램"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
-        # 수익률을 퍼센트로 변환
-        lump_sum_returns = df['lump_sum_return'] * 100
-        dca_returns = df['dca_return'] * 100
+        # 퍼센트 수익률
+        lump_sum_returns = df['lump_sum_return_pct']
+        dca_returns = df['dca_return_pct']
+        stats = self._get_summary_stats(df)
+        lump_sum_mean = stats['lump_sum_return_pct']
+        dca_mean = stats['dca_return_pct']
         
         # 히스토그램 생성
         ax.hist(lump_sum_returns, bins=30, alpha=0.7, color='#1f77b4', 
-                label=f'일시투자 (평균: {lump_sum_returns.mean():.1f}%)', density=True)
+                label=f'일시투자 (평균: {lump_sum_mean:.1f}%)', density=True)
         ax.hist(dca_returns, bins=30, alpha=0.7, color='#ff7f0e', 
-                label=f'적립투자 (평균: {dca_returns.mean():.1f}%)', density=True)
+                label=f'적립투자 (평균: {dca_mean:.1f}%)', density=True)
         
         # 평균선 표시
-        ax.axvline(lump_sum_returns.mean(), color='#1f77b4', linestyle='--', linewidth=2, alpha=0.8)
-        ax.axvline(dca_returns.mean(), color='#ff7f0e', linestyle='--', linewidth=2, alpha=0.8)
+        ax.axvline(lump_sum_mean, color='#1f77b4', linestyle='--', linewidth=2, alpha=0.8)
+        ax.axvline(dca_mean, color='#ff7f0e', linestyle='--', linewidth=2, alpha=0.8)
         
         ax.set_title(f'{self.symbol} 투자전략별 수익률 분포 비교\n({len(df)}개 롤링 윈도우 분석)', 
                     fontsize=16, fontweight='bold', pad=20)
@@ -231,30 +416,27 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # 통계 정보 텍스트
-        stats_text = f'통계 요약\n일시투자: 평균 {lump_sum_returns.mean():.1f}%, 표준편차 {lump_sum_returns.std():.1f}%\n적립투자: 평균 {dca_returns.mean():.1f}%, 표준편차 {dca_returns.std():.1f}%'
+        stats_text = f'통계 요약\n일시투자: 평균 {lump_sum_mean:.1f}%, 표준편차 {lump_sum_returns.std():.1f}%\n적립투자: 평균 {dca_mean:.1f}%, 표준편차 {dca_returns.std():.1f}%'
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f'롤링_수익률분포_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_수익률분포')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_risk_return_scatter_chart(self, df: pd.DataFrame) -> str:
         """3. 위험-수익 산점도"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
         # 데이터 준비 (퍼센트 변환)
-        lump_sum_vol = df['lump_sum_volatility'] * 100
-        lump_sum_cagr = df['lump_sum_cagr'] * 100
+        lump_sum_vol = df['lump_sum_vol_pct']
+        lump_sum_cagr = df['lump_sum_cagr_pct']
         lump_sum_sharpe = df['lump_sum_sharpe']
         
-        dca_vol = df['dca_volatility'] * 100
-        dca_cagr = df['dca_cagr'] * 100
+        dca_vol = df['dca_vol_pct']
+        dca_cagr = df['dca_cagr_pct']
         dca_sharpe = df['dca_sharpe']
         
         # 산점도 그리기 (샤프지수에 따른 점 크기)
@@ -266,23 +448,33 @@ class RollingChartGenerator:
                              label='적립투자', edgecolors='darkorange', linewidth=0.5)
         
         # 효율적 프론티어 근사선 (상위 25% 포인트들)
-        combined_data = pd.DataFrame({
-            'vol': np.concatenate([lump_sum_vol, dca_vol]),
-            'cagr': np.concatenate([lump_sum_cagr, dca_cagr]),
-            'sharpe': np.concatenate([lump_sum_sharpe, dca_sharpe])
-        })
+        vol = np.concatenate([lump_sum_vol.to_numpy(), dca_vol.to_numpy()])
+        cagr = np.concatenate([lump_sum_cagr.to_numpy(), dca_cagr.to_numpy()])
         
         # 변동성 구간별 최고 CAGR 포인트들로 효율적 프론티어 그리기
-        vol_bins = np.linspace(combined_data['vol'].min(), combined_data['vol'].max(), 10)
+        # 구간 [b_i, b_i+1) 배정 후 구간 순으로 정렬하여 구간별 최대값을 한 번에 계산
+        vol_bins = np.linspace(np.nanmin(vol), np.nanmax(vol), 10)
+        bucket = np.digitize(vol, vol_bins) - 1
+        in_range = (bucket >= 0) & (bucket < len(vol_bins) - 1)
+        
+        order = np.argsort(bucket[in_range], kind='stable')
+        bucket_sorted = bucket[in_range][order]
+        vol_sorted = vol[in_range][order]
+        cagr_sorted = cagr[in_range][order]
+        
         frontier_vol = []
         frontier_cagr = []
-        
-        for i in range(len(vol_bins)-1):
-            mask = (combined_data['vol'] >= vol_bins[i]) & (combined_data['vol'] < vol_bins[i+1])
-            if mask.sum() > 0:
-                max_cagr_idx = combined_data.loc[mask, 'cagr'].idxmax()
-                frontier_vol.append(combined_data.loc[max_cagr_idx, 'vol'])
-                frontier_cagr.append(combined_data.loc[max_cagr_idx, 'cagr'])
+        if len(bucket_sorted) > 0:
+            starts = np.unique(bucket_sorted, return_index=True)[1]
+            segment_max = np.fmax.reduceat(cagr_sorted, starts)
+            segment_id = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(bucket_sorted))))
+            
+            # 구간별 최대 CAGR의 첫 번째 포인트 선택
+            is_max = cagr_sorted == segment_max[segment_id]
+            first_max = np.unique(segment_id[is_max], return_index=True)[1]
+            frontier_idx = np.flatnonzero(is_max)[first_max]
+            frontier_vol = vol_sorted[frontier_idx]
+            frontier_cagr = cagr_sorted[frontier_idx]
         
         if len(frontier_vol) > 2:
             ax.plot(frontier_vol, frontier_cagr, '--', color='gray', alpha=0.8, linewidth=2, label='효율적 프론티어')
@@ -300,95 +492,101 @@ class RollingChartGenerator:
                 verticalalignment='bottom', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f'롤링_위험수익분석_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_위험수익분석')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_performance_heatmap_chart(self, df: pd.DataFrame) -> str:
         """4. 성과 차이 히트맵"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
         # 연도-월별 데이터 준비
-        df['year'] = df['date'].dt.year
-        df['month'] = df['date'].dt.month
-        df['return_diff_pct'] = df['return_difference'] * 100
-        
-        # 피벗 테이블 생성
-        heatmap_data = df.pivot_table(values='return_diff_pct', 
-                                     index='year', columns='month', 
-                                     aggfunc='mean')
-        
-        # 히트맵 그리기
-        sns.heatmap(heatmap_data, annot=True, fmt='.1f', cmap='RdYlBu_r', 
-                   center=0, ax=ax, cbar_kws={'label': '수익률 차이 (%)'})
+        years = df['year'].to_numpy()
+        months = df['month'].to_numpy()
+        return_diff_pct = df['return_diff_pct'].to_numpy(np.float64)
+        
+        # 연도 x 월 평균 행렬 생성 (데이터가 없는 칸은 NaN)
+        first_year = years.min()
+        year_offsets = years - first_year
+        n_years = year_offsets.max() + 1
+        sums = np.zeros((n_years, 12))
+        counts = np.zeros((n_years, 12))
+        np.add.at(sums, (year_offsets, months - 1), return_diff_pct)
+        np.add.at(counts, (year_offsets, months - 1), 1)
+        heatmap_data = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+        
+        # 데이터가 있는 연도만 표시
+        present_years = counts.sum(axis=1) > 0
+        heatmap_data = heatmap_data[present_years]
+        year_labels = np.arange(first_year, first_year + n_years)[present_years]
+        
+        # 히트맵 그리기 (0을 중심으로 대칭인 색상 범위)
+        vmax = np.nanmax(np.abs(heatmap_data)) if np.isfinite(heatmap_data).any() else 1.0
+        im = ax.imshow(heatmap_data, cmap='RdYlBu_r', aspect='auto', vmin=-vmax, vmax=vmax)
+        fig.colorbar(im, ax=ax, label='수익률 차이 (%)')
+        ax.grid(False)
+        
+        # 셀 값 표시 (배경 밝기에 따라 글자색 선택, 빈 칸은 생략)
+        rgba = im.cmap(im.norm(heatmap_data))
+        luminance = rgba[..., :3] @ np.array([0.2126, 0.7152, 0.0722])
+        for (i, j), value in np.ndenumerate(heatmap_data):
+            if not np.isnan(value):
+                ax.text(j, i, f'{value:.1f}', ha='center', va='center',
+                        color='black' if luminance[i, j] > 0.408 else 'white')
         
         ax.set_title(f'{self.symbol} 투자시점별 성과차이 히트맵\n(일시투자 - 적립투자, %)', 
                     fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('투자 시작 월', fontsize=12)
         ax.set_ylabel('투자 시작 연도', fontsize=12)
         
-        # 월 라벨 설정
+        # 월/연도 라벨 설정
+        ax.set_xticks(range(12))
         ax.set_xticklabels(['1월', '2월', '3월', '4월', '5월', '6월', 
                            '7월', '8월', '9월', '10월', '11월', '12월'])
+        ax.set_yticks(range(len(year_labels)))
+        ax.set_yticklabels(year_labels)
         
-        plt.tight_layout()
-        
-        filename = f'롤링_성과히트맵_{self.symbol}_{self.start_year}_{self.end_year}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_fixed_filepath('롤링_성과히트맵')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_mdd_win_rate_chart(self, df: pd.DataFrame) -> str:
         """5. MDD 구간별 승률 분석"""
-        fig, ax = plt.subplots(figsize=(15, 9))
-        
-        # MDD 구간 정의 (더 정밀한 구간)
-        df['lump_sum_mdd_pct'] = df['lump_sum_mdd'] * 100
-        df['dca_mdd_pct'] = df['dca_mdd'] * 100
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
         # 평균 MDD로 구간 나누기
-        df['avg_mdd'] = (df['lump_sum_mdd_pct'] + df['dca_mdd_pct']) / 2
+        avg_mdd = (df['lump_sum_mdd_pct'].to_numpy(np.float64) + df['dca_mdd_pct'].to_numpy(np.float64)) / 2
         
-        # MDD 구간별 승률 계산
-        mdd_bins = [0, 10, 20, 30, 40, 50, 100]
+        # MDD 구간별 승률 계산 (오른쪽 닫힌 구간, 첫 구간은 0 포함, 범위 밖은 제외)
+        mdd_bins = np.array([0, 10, 20, 30, 40, 50, 100])
         mdd_labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50%+']
         
-        df['mdd_range'] = pd.cut(df['avg_mdd'], bins=mdd_bins, labels=mdd_labels, include_lowest=True)
-        
-        mdd_stats = df.groupby('mdd_range').agg({
-            'win': ['mean', 'count'],
-            'return_difference': 'mean',
-            'lump_sum_mdd_pct': 'mean',
-            'dca_mdd_pct': 'mean'
-        }).round(4)
+        in_range = (avg_mdd >= mdd_bins[0]) & (avg_mdd <= mdd_bins[-1])
+        bin_idx = np.maximum(np.searchsorted(mdd_bins, avg_mdd[in_range], side='left') - 1, 0)
+        sample_counts = np.bincount(bin_idx, minlength=len(mdd_labels))
+        win_sums = np.bincount(bin_idx, weights=df['win'].to_numpy(np.float64)[in_range],
+                               minlength=len(mdd_labels))
         
-        # 구간별 승률 막대 그래프
-        win_rates = mdd_stats[('win', 'mean')] * 100
-        sample_counts = mdd_stats[('win', 'count')]
+        # 구간별 승률 막대 그래프 (표본이 없는 구간은 NaN)
+        win_rates = np.round(np.divide(win_sums, sample_counts, out=np.full(len(mdd_labels), np.nan),
+                                       where=sample_counts > 0), 4) * 100
         
-        # 막대 그래프 생성
-        bars = ax.bar(range(len(win_rates)), win_rates, 
-                     alpha=0.7, edgecolor='black', linewidth=1)
-        
-        # 막대별로 색상 설정 (50% 이상은 녹색, 미만은 빨간색)
-        for bar, win_rate in zip(bars, win_rates):
-            if win_rate > 50:
-                bar.set_facecolor('green')
-            else:
-                bar.set_facecolor('red')
+        # 막대 그래프 생성 (50% 초과는 녹색, 이하는 빨간색)
+        bar_colors = np.where(win_rates > 50, 'green', 'red')
+        ax.bar(range(len(win_rates)), win_rates, color=bar_colors,
+               alpha=0.7, edgecolor='black', linewidth=1)
         
         # 50% 기준선
         ax.axhline(y=50, color='blue', linestyle='--', linewidth=2, alpha=0.8, label='균형점 (50%)')
         
         # 막대 위에 값 표시
         for i, (win_rate, count) in enumerate(zip(win_rates, sample_counts)):
+            if np.isnan(win_rate):
+                continue  # 표본이 없는 구간은 표시할 값이 없음
             ax.text(i, win_rate + 2, f'{win_rate:.1f}%\n(n={count})', 
                    ha='center', va='bottom', fontweight='bold')
         
@@ -402,38 +600,34 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3, axis='y')
         ax.set_ylim(0, 100)
         
-        plt.tight_layout()
-        
-        filename = f'롤링_MDD승률분석_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_MDD승률분석')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_cumulative_performance_chart(self, df: pd.DataFrame) -> str:
         """6. 시간 순서별 누적 성과"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
-        # 시간순 정렬
-        df_sorted = df.sort_values('date').reset_index(drop=True)
-        
-        # 누적 평균 계산
-        df_sorted['cumulative_lump_sum'] = df_sorted['lump_sum_return'].expanding().mean() * 100
-        df_sorted['cumulative_dca'] = df_sorted['dca_return'].expanding().mean() * 100
-        df_sorted['cumulative_win_rate'] = df_sorted['win'].expanding().mean() * 100
+        # 누적 평균 계산 (df는 prepare_dataframe에서 날짜순 정렬됨)
+        positions = np.arange(len(df))
+        counts = positions + 1
+        cumulative_lump_sum = np.cumsum(df['lump_sum_return'].to_numpy(np.float64)) / counts * 100
+        cumulative_dca = np.cumsum(df['dca_return'].to_numpy(np.float64)) / counts * 100
+        cumulative_win_rate = np.cumsum(df['win'].to_numpy(np.float64)) / counts * 100
         
         # 이중 Y축 설정
         ax2 = ax.twinx()
         
         # 누적 평균 수익률
-        line1 = ax.plot(df_sorted.index, df_sorted['cumulative_lump_sum'], 
+        line1 = ax.plot(positions, cumulative_lump_sum, 
                        color='#1f77b4', linewidth=3, label='일시투자 누적평균수익률')
-        line2 = ax.plot(df_sorted.index, df_sorted['cumulative_dca'], 
+        line2 = ax.plot(positions, cumulative_dca, 
                        color='#ff7f0e', linewidth=3, label='적립투자 누적평균수익률')
         
         # 누적 승률 (오른쪽 축)
-        line3 = ax2.plot(df_sorted.index, df_sorted['cumulative_win_rate'], 
+        line3 = ax2.plot(positions, cumulative_win_rate, 
                         color='green', linewidth=2, linestyle='--', label='일시투자 누적승률')
         
         # 50% 승률 기준선
@@ -453,37 +647,37 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3)
         ax2.set_ylim(0, 100)
         
-        plt.tight_layout()
-        
-        filename = f'롤링_누적성과_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_누적성과')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_sharpe_comparison_chart(self, df: pd.DataFrame) -> str:
         """7. 샤프지수 비교"""
-        fig, ax = plt.subplots(figsize=(15, 9))
+        fig = self._get_figure((15, 9))
+        ax = fig.subplots()
         
         # 샤프지수 차이 계산
         df['sharpe_difference'] = df['lump_sum_sharpe'] - df['dca_sharpe']
         
-        # 시간순 정렬
-        df_sorted = df.sort_values('date')
+        # 그리기용 배열과 우위 마스크는 한 번만 생성하여 공유
+        dates = df['date'].to_numpy()
+        lump_sum_sharpe = df['lump_sum_sharpe'].to_numpy()
+        dca_sharpe = df['dca_sharpe'].to_numpy()
+        lump_sum_wins = lump_sum_sharpe > dca_sharpe
         
         # 샤프지수 시계열
-        ax.plot(df_sorted['date'], df_sorted['lump_sum_sharpe'], 
+        ax.plot(dates, lump_sum_sharpe, 
                linewidth=2, color='#1f77b4', label='일시투자 샤프지수', alpha=0.8)
-        ax.plot(df_sorted['date'], df_sorted['dca_sharpe'], 
+        ax.plot(dates, dca_sharpe, 
                linewidth=2, color='#ff7f0e', label='적립투자 샤프지수', alpha=0.8)
         
         # 차이 영역 표시
-        ax.fill_between(df_sorted['date'], df_sorted['lump_sum_sharpe'], df_sorted['dca_sharpe'],
-                       where=(df_sorted['lump_sum_sharpe'] > df_sorted['dca_sharpe']),
+        ax.fill_between(dates, lump_sum_sharpe, dca_sharpe,
+                       where=lump_sum_wins,
                        color='blue', alpha=0.2, interpolate=True, label='일시투자 우위')
-        ax.fill_between(df_sorted['date'], df_sorted['lump_sum_sharpe'], df_sorted['dca_sharpe'],
-                       where=(df_sorted['lump_sum_sharpe'] <= df_sorted['dca_sharpe']),
+        ax.fill_between(dates, lump_sum_sharpe, dca_sharpe,
+                       where=~lump_sum_wins,
                        color='orange', alpha=0.2, interpolate=True, label='적립투자 우위')
         
         ax.set_title(f'{self.symbol} 샤프지수 시계열 비교\n(위험조정수익률 분석)', 
@@ -494,51 +688,46 @@ class RollingChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # X축 날짜 포맷
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.YearLocator())
-        plt.xticks(rotation=45)
+        ax.xaxis.set_major_formatter(self._YM_FMT)
+        ax.xaxis.set_major_locator(self._YR_LOC_1)
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 통계 정보
-        lump_avg_sharpe = df['lump_sum_sharpe'].mean()
-        dca_avg_sharpe = df['dca_sharpe'].mean()
-        sharpe_win_rate = (df['sharpe_difference'] > 0).mean() * 100
+        stats = self._get_summary_stats(df)
+        lump_avg_sharpe = stats['lump_sum_sharpe']
+        dca_avg_sharpe = stats['dca_sharpe']
+        sharpe_win_rate = stats['sharpe_win_rate'] * 100
         
         stats_text = f'평균 샤프지수\n일시투자: {lump_avg_sharpe:.3f}\n적립투자: {dca_avg_sharpe:.3f}\n일시투자 우위: {sharpe_win_rate:.1f}%'
         ax.text(0.98, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f'롤링_샤프지수비교_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_샤프지수비교')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_volatility_analysis_chart(self, df: pd.DataFrame) -> str:
         """8. 변동성 분석"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 12))
+        fig = self._get_figure((15, 12))
+        ax1, ax2 = fig.subplots(2, 1)
         
-        # 변동성 데이터 준비 (퍼센트 변환)
-        df['lump_sum_vol_pct'] = df['lump_sum_volatility'] * 100
-        df['dca_vol_pct'] = df['dca_volatility'] * 100
+        # 변동성 차이 (퍼센트)
         df['vol_difference'] = df['lump_sum_vol_pct'] - df['dca_vol_pct']
         
         # 상단: 변동성 시계열
-        df_sorted = df.sort_values('date')
-        ax1.plot(df_sorted['date'], df_sorted['lump_sum_vol_pct'], 
+        ax1.plot(df['date'], df['lump_sum_vol_pct'], 
                 linewidth=2, color='#1f77b4', label='일시투자 변동성', alpha=0.8)
-        ax1.plot(df_sorted['date'], df_sorted['dca_vol_pct'], 
+        ax1.plot(df['date'], df['dca_vol_pct'], 
                 linewidth=2, color='#ff7f0e', label='적립투자 변동성', alpha=0.8)
         
         ax1.set_title(f'{self.symbol} 변동성 시계열 분석', fontsize=14, fontweight='bold')
         ax1.set_ylabel('연환산 변동성 (%)', fontsize=12)
         ax1.legend(fontsize=11)
         ax1.grid(True, alpha=0.3)
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax1.xaxis.set_major_locator(mdates.YearLocator())
+        ax1.xaxis.set_major_formatter(self._YM_FMT)
+        ax1.xaxis.set_major_locator(self._YR_LOC_1)
         
         # 하단: 변동성 차이 분포
         ax2.hist(df['vol_difference'], bins=20, alpha=0.7, color='purple', 
@@ -553,18 +742,15 @@ class RollingChartGenerator:
         ax2.legend(fontsize=11)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        filename = f'롤링_변동성분석_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_변동성분석')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_final_value_distribution_chart(self, df: pd.DataFrame) -> str:
         """9. 최종가치 분포"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
+        fig = self._get_figure((18, 8))
+        ax1, ax2 = fig.subplots(1, 2)
         
         # 최종가치를 천만원 단위로 변환
         df['lump_sum_value_10m'] = df['lump_sum_final_value'] / 1e7
@@ -587,15 +773,13 @@ class RollingChartGenerator:
         ax1.grid(True, alpha=0.3)
         
         # 우측: 가치 차이 분포
-        n, bins, patches = ax2.hist(df['value_diff_10m'], bins=20, alpha=0.7, 
-                                   edgecolor='black', linewidth=1)
-        
-        # 막대별로 색상 설정 (양수는 녹색, 음수는 빨간색)
-        for i, (patch, bin_center) in enumerate(zip(patches, (bins[:-1] + bins[1:]) / 2)):
-            if bin_center > 0:
-                patch.set_facecolor('green')
-            else:
-                patch.set_facecolor('red')
+        value_diff = df['value_diff_10m'].to_numpy(np.float64)
+        counts, bins = np.histogram(value_diff[~np.isnan(value_diff)], bins=20)
+        bin_centers = (bins[:-1] + bins[1:]) * 0.5
+        
+        # 구간 중심이 양수면 녹색, 음수면 빨간색
+        ax2.bar(bin_centers, counts, width=np.diff(bins), color=np.where(bin_centers > 0, 'green', 'red'),
+                alpha=0.7, edgecolor='black', linewidth=1)
         ax2.axvline(df['value_diff_10m'].mean(), color='blue', linestyle='--', linewidth=2,
                    label=f'평균 차이: {df["value_diff_10m"].mean():.1f}천만')
         ax2.axvline(0, color='black', linestyle='-', linewidth=1, alpha=0.5)
@@ -610,18 +794,14 @@ class RollingChartGenerator:
         fig.suptitle(f'{self.symbol} 최종 포트폴리오 가치 분석 ({len(df)}개 시나리오)', 
                     fontsize=16, fontweight='bold')
         
-        plt.tight_layout()
-        
-        filename = f'롤링_최종가치분포_{self.symbol}_{self.start_year}_{self.end_year}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_timestamped_filepath('롤링_최종가치분포')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
     
     def create_summary_dashboard_chart(self, df: pd.DataFrame) -> str:
         """10. 통계 요약 대시보드"""
-        fig = plt.figure(figsize=(20, 12))
+        fig = self._get_figure((20, 12))
         
         # 2x3 그리드 레이아웃
         gs = fig.add_gridspec(3, 3, height_ratios=[1, 1, 1], width_ratios=[1, 1, 1])
@@ -629,12 +809,10 @@ class RollingChartGenerator:
         # 1. 기본 통계
         ax1 = fig.add_subplot(gs[0, 0])
         metrics = ['수익률', 'CAGR', 'MDD', '샤프지수', '변동성']
-        lump_sum_values = [df['lump_sum_return'].mean(), df['lump_sum_cagr'].mean(), 
-                          df['lump_sum_mdd'].mean(), df['lump_sum_sharpe'].mean(), 
-                          df['lump_sum_volatility'].mean()]
-        dca_values = [df['dca_return'].mean(), df['dca_cagr'].mean(), 
-                     df['dca_mdd'].mean(), df['dca_sharpe'].mean(), 
-                     df['dca_volatility'].mean()]
+        stats = self._get_summary_stats(df)
+        metric_columns = ['return', 'cagr', 'mdd', 'sharpe', 'volatility']
+        lump_sum_values = [stats[f'lump_sum_{col}'] for col in metric_columns]
+        dca_values = [stats[f'dca_{col}'] for col in metric_columns]
         
         x = np.arange(len(metrics))
         width = 0.35
@@ -652,17 +830,17 @@ class RollingChartGenerator:
         
         # 2. 승률 파이차트
         ax2 = fig.add_subplot(gs[0, 1])
-        win_rate = df['win'].mean()
+        win_rate = stats['win']
         sizes = [win_rate, 1-win_rate]
         colors = ['lightblue', 'lightcoral']
-        labels = [f'일시투자 승\n{win_rate:.1%}', f'적립투자 승\n{1-win_rate:.1%}']
+        labels = [f'일시투자 승\n{win_rate*100:.1f}%', f'적립투자 승\n{(1-win_rate)*100:.1f}%']
         
         ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
         ax2.set_title('전체 승률 분포', fontweight='bold')
         
         # 3. CAGR 분포 박스플롯
         ax3 = fig.add_subplot(gs[0, 2])
-        box_data = [df['lump_sum_cagr']*100, df['dca_cagr']*100]
+        box_data = [df['lump_sum_cagr_pct'], df['dca_cagr_pct']]
         ax3.boxplot(box_data, labels=['일시투자', '적립투자'])
         ax3.set_title('CAGR 분포 (박스플롯)', fontweight='bold')
         ax3.set_ylabel('CAGR (%)')
@@ -670,19 +848,13 @@ class RollingChartGenerator:
         
         # 4. 연도별 승률
         ax4 = fig.add_subplot(gs[1, :])
-        df['year'] = df['date'].dt.year
-        yearly_win_rate = df.groupby('year')['win'].mean() * 100
-        
-        # 막대 그래프 생성
-        bars = ax4.bar(yearly_win_rate.index, yearly_win_rate.values, 
-                      alpha=0.7, edgecolor='black', linewidth=1)
-        
-        # 막대별로 색상 설정 (50% 이상은 녹색, 미만은 빨간색)
-        for bar, win_rate in zip(bars, yearly_win_rate.values):
-            if win_rate > 50:
-                bar.set_facecolor('green')
-            else:
-                bar.set_facecolor('red')
+        win_years, yearly_win, _ = _yearly_mean(
+            df['year'].to_numpy(), df['win'].to_numpy(np.float64))
+        yearly_win_rate = yearly_win * 100
+        
+        # 막대 그래프 생성 (50% 초과는 녹색, 이하는 빨간색)
+        bars = ax4.bar(win_years, yearly_win_rate, color=np.where(yearly_win_rate > 50, 'green', 'red'),
+                       alpha=0.7, edgecolor='black', linewidth=1)
         ax4.axhline(y=50, color='blue', linestyle='--', linewidth=2, alpha=0.8)
         ax4.set_title('연도별 일시투자 승률 추이', fontweight='bold', pad=15)
         ax4.set_xlabel('연도')
@@ -691,7 +863,7 @@ class RollingChartGenerator:
         ax4.grid(True, alpha=0.3)
         
         # 막대 위에 값 표시
-        for bar, value in zip(bars, yearly_win_rate.values):
+        for bar, value in zip(bars, yearly_win_rate):
             ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2, 
                     f'{value:.1f}%', ha='center', va='bottom', fontsize=9)
         
@@ -699,29 +871,40 @@ class RollingChartGenerator:
         ax5 = fig.add_subplot(gs[2, :])
         ax5.axis('off')
         
-        # 통계 테이블 생성
-        stats_data = [
-            ['지표', '일시투자', '적립투자', '차이', '일시투자 우위율'],
-            ['평균 수익률', f'{df["lump_sum_return"].mean():.1%}', f'{df["dca_return"].mean():.1%}', 
-             f'{df["return_difference"].mean():.1%}', f'{(df["return_difference"] > 0).mean():.1%}'],
-            ['평균 CAGR', f'{df["lump_sum_cagr"].mean():.1%}', f'{df["dca_cagr"].mean():.1%}', 
-             f'{(df["lump_sum_cagr"] - df["dca_cagr"]).mean():.1%}', f'{(df["lump_sum_cagr"] > df["dca_cagr"]).mean():.1%}'],
-            ['평균 MDD', f'{df["lump_sum_mdd"].mean():.1%}', f'{df["dca_mdd"].mean():.1%}', 
-             f'{(df["lump_sum_mdd"] - df["dca_mdd"]).mean():.1%}', f'{(df["lump_sum_mdd"] < df["dca_mdd"]).mean():.1%}'],
-            ['평균 샤프지수', f'{df["lump_sum_sharpe"].mean():.3f}', f'{df["dca_sharpe"].mean():.3f}', 
-             f'{(df["lump_sum_sharpe"] - df["dca_sharpe"]).mean():.3f}', f'{(df["lump_sum_sharpe"] > df["dca_sharpe"]).mean():.1%}'],
-            ['평균 변동성', f'{df["lump_sum_volatility"].mean():.1%}', f'{df["dca_volatility"].mean():.1%}', 
-             f'{(df["lump_sum_volatility"] - df["dca_volatility"]).mean():.1%}', f'{(df["lump_sum_volatility"] < df["dca_volatility"]).mean():.1%}']
-        ]
-        
-        table = ax5.table(cellText=stats_data[1:], colLabels=stats_data[0], 
+        # 통계 테이블 생성 (지표별 차이 평균/우위율을 한 번에 계산한 뒤 셀 문자열 일괄 생성)
+        metrics = ('cagr', 'mdd', 'sharpe', 'volatility')
+        lump_values = df[[f'lump_sum_{m}' for m in metrics]].to_numpy(np.float64)
+        dca_values = df[[f'dca_{m}' for m in metrics]].to_numpy(np.float64)
+        diff_means = np.nanmean(lump_values - dca_values, axis=0)
+        lump_higher = (lump_values > dca_values).mean(axis=0)
+        lump_lower = (lump_values < dca_values).mean(axis=0)
+        row_labels = ['평균 수익률', '평균 CAGR', '평균 MDD', '평균 샤프지수', '평균 변동성']
+        # 행별 (일시투자 평균, 적립투자 평균, 차이 평균, 일시투자 우위율)
+        cell_values = np.array([
+            [stats['lump_sum_return'], stats['dca_return'], stats['return_difference'], stats['win']],
+            [stats['lump_sum_cagr'], stats['dca_cagr'], diff_means[0], lump_higher[0]],
+            [stats['lump_sum_mdd'], stats['dca_mdd'], diff_means[1], lump_lower[1]],
+            [stats['lump_sum_sharpe'], stats['dca_sharpe'], diff_means[2], stats['sharpe_win_rate']],
+            [stats['lump_sum_volatility'], stats['dca_volatility'], diff_means[3], lump_lower[3]],
+        ], dtype=np.float64)
+        
+        # 전체 셀을 한 번에 포맷 (샤프지수 행의 값만 소수 3자리, 나머지는 백분율)
+        percent_cells = np.zeros(cell_values.shape, dtype=bool)
+        percent_cells[[0, 1, 2, 4], :] = True
+        percent_cells[:, 3] = True
+        cell_text = np.where(percent_cells,
+                             np.char.mod('%.1f%%', cell_values * 100),
+                             np.char.mod('%.3f', cell_values))
+        cell_text = np.column_stack([row_labels, cell_text]).tolist()
+        
+        table = ax5.table(cellText=cell_text, colLabels=self._STATS_TABLE_HEADER, 
                          cellLoc='center', loc='center', bbox=[0, 0, 1, 1])
         table.auto_set_font_size(False)
         table.set_fontsize(10)
         table.scale(1, 2)
         
         # 헤더 스타일링
-        for i in range(len(stats_data[0])):
+        for i in range(len(self._STATS_TABLE_HEADER)):
             table[(0, i)].set_facecolor('#4CAF50')
             table[(0, i)].set_text_props(weight='bold', color='white')
         
@@ -730,11 +913,7 @@ class RollingChartGenerator:
                     f'({self.start_year}~{self.end_year}, {len(df)}개 시나리오, {self.investment_period_years}년 투자)', 
                     fontsize=18, fontweight='bold')
         
-        plt.tight_layout()
-        
-        filename = f'롤링_종합대시보드_{self.symbol}_{self.start_year}_{self.end_year}.png'
-        filepath = self.chart_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        filepath = self._get_fixed_filepath('롤링_종합대시보드')
+        fig.savefig(filepath, dpi=150)
         
         return str(filepath)
\ No newline at end of file
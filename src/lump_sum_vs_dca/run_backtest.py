@@ -69,13 +69,14 @@ def run_backtest():
         
         # 결과 요약 출력
         print("\n[3] 결과 요약:")
-        summary = analyzer.generate_summary(comparison_result)
+        metrics = analyzer.calculate_comparison_metrics(comparison_result)
+        summary = analyzer.generate_summary(comparison_result, metrics)
         print(summary)
         
         # Excel 출력
         print("[4] Excel 파일 생성 중...")
         exporter = ExcelExporter(config)
-        excel_file = exporter.export_analysis(comparison_result, analyzer)
+        excel_file = exporter.export_analysis(comparison_result, analyzer, metrics)
         
         # 차트 생성
         print("[5] 차트 생성 중...")
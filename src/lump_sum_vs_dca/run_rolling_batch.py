@@ -5,16 +5,28 @@
 
 import os
 import sys
+import math
+from copy import copy
 import pandas as pd
+import numpy as np
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.styles.numbers import FORMAT_PERCENTAGE_00
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Tuple
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
 from rolling_chart_generator import RollingChartGenerator
 
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 NumPy 배열 연산으로 계산
+    njit = None
+
 # 경로 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_src_dir = os.path.dirname(current_dir)
@@ -23,6 +35,11 @@ sys.path.insert(0, current_dir)
 sys.path.insert(0, parent_src_dir)
 sys.path.insert(0, strategies_dir)
 
+# 백테스트 모듈은 경로 설정 후 모듈 로드 시 한 번만 import (기간별 호출마다 import 문 실행 방지)
+from config import LumpSumVsDcaConfig
+from lump_sum_vs_dca_backtester import LumpSumVsDcaBacktester
+from analyzer import sample_mean_std
+
 # 롤링 백테스트 설정 변수들 (여기를 수정하세요)
 BATCH_CONFIG = {
     'symbol': 'S&P500',                    # 투자 지수
@@ -33,18 +50,98 @@ BATCH_CONFIG = {
     'investment_period_years': 10,         # 각 테스트의 투자 기간 (년)
     'dca_months': 60,                      # 적립 분할 월수
     'generate_charts': True,               # 차트 생성 여부 (True: 생성, False: 생성 안함)
+    'max_workers': None,                   # 병렬 프로세스 수 (None: CPU 코어 수, 1: 순차 실행)
+    'vectorized': True,                    # NumPy 일괄 계산 사용 (False: 기간마다 백테스터 실행)
+    'price_dtype': 'float64',              # 벡터화 경로 가격/누적 배열 자료형 ('float32': 메모리 절반, 유효숫자 약 7자리로 결과 미세 차이)
+}
+
+
+# 연환산 계수 (365.25일 기준)
+_ANN = 365.25
+_SQRT_ANN = math.sqrt(_ANN)
+
+# 엑셀 출력 컬럼 순서 및 한글 컬럼명
+_EXCEL_COLUMN_NAMES = {
+    'period': '시작기간',
+    'end_period': '종료기간',
+    'lump_sum_return': '일시투자_수익률',
+    'lump_sum_cagr': '일시투자_CAGR',
+    'lump_sum_mdd': '일시투자_MDD',
+    'lump_sum_sharpe': '일시투자_샤프지수',
+    'lump_sum_volatility': '일시투자_변동성',
+    'lump_sum_final_value': '일시투자_최종가치',
+    'dca_return': '적립투자_수익률',
+    'dca_cagr': '적립투자_CAGR',
+    'dca_mdd': '적립투자_MDD',
+    'dca_sharpe': '적립투자_샤프지수',
+    'dca_volatility': '적립투자_변동성',
+    'dca_final_value': '적립투자_최종가치',
+    'return_difference': '수익률차이',
+    'cagr_difference': 'CAGR차이',
+    'value_difference': '가치차이'
 }
 
 
+# 기간별 결과 레코드 구조 (시작기간/종료기간 문자열은 시작년월로부터 복원)
+_RESULT_DTYPE = np.dtype([
+    ('start_year', np.int64), ('start_month', np.int64),
+    ('lump_sum_return', np.float64), ('lump_sum_cagr', np.float64), ('lump_sum_mdd', np.float64),
+    ('lump_sum_sharpe', np.float64), ('lump_sum_volatility', np.float64), ('lump_sum_final_value', np.float64),
+    ('dca_return', np.float64), ('dca_cagr', np.float64), ('dca_mdd', np.float64),
+    ('dca_sharpe', np.float64), ('dca_volatility', np.float64), ('dca_final_value', np.float64),
+    ('return_difference', np.float64), ('cagr_difference', np.float64), ('value_difference', np.float64),
+])
+
+@lru_cache(maxsize=None)
+def _get_config_template():
+    """기본 설정 템플릿 (프로세스당 한 번 생성, 생성 시 결과 디렉토리 확인/생성 포함)"""
+    return LumpSumVsDcaConfig()
+
+
+@lru_cache(maxsize=None)
+def _load_price_data(symbol: str) -> pd.DataFrame:
+    """지수 가격 데이터 로드 (프로세스당 심볼별로 한 번만 읽어 모든 롤링 기간이 공유)"""
+    return LumpSumVsDcaBacktester(_get_config_template()).load_data(symbol)
+
+
+def _daily_portfolio_returns(daily_data: pd.DataFrame) -> np.ndarray:
+    """일별 포트폴리오 수익률 배열 (total_return 차분, 없으면 평가금액 변화율, NaN 제외)"""
+    if 'total_return' in daily_data.columns:
+        returns = np.diff(daily_data['total_return'].to_numpy(np.float64))
+    else:
+        values = daily_data['current_value'].to_numpy(np.float64)
+        # 나눗셈 결과 버퍼에서 바로 1을 빼 임시 배열 없이 계산
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.divide(values[1:], values[:-1])
+        returns -= 1
+    
+    # 합계가 NaN이 아니면 NaN이 없으므로 마스크 생성/복사 없이 그대로 사용
+    with np.errstate(invalid='ignore'):
+        if not np.isnan(returns.sum()):
+            return returns
+    return returns[~np.isnan(returns)]
+
+
+def _annualized_volatility_sharpe(returns: np.ndarray, risk_free_rate: float = 0.02) -> Tuple[float, float]:
+    """연환산 변동성과 샤프 지수 (365.25일 기준, 무위험수익률 2%)"""
+    if len(returns) == 0:
+        return 0, 0
+    
+    # 표본이 1개면 표준편차를 정의할 수 없음 (pandas std와 동일하게 NaN)
+    mean, std = sample_mean_std(returns)
+    volatility = std * _SQRT_ANN
+    mean_return = mean * _ANN
+    
+    sharpe = (mean_return - risk_free_rate) / volatility if volatility > 0 else 0
+    return volatility, sharpe
+
+
 def run_single_backtest_silent(symbol: str, start_year: int, start_month: int, 
                               investment_period_years: int, dca_months: int) -> Dict[str, Any]:
     """단일 백테스트 실행"""
     try:
-        from config import LumpSumVsDcaConfig
-        from lump_sum_vs_dca_backtester import LumpSumVsDcaBacktester
-        from analyzer import PerformanceAnalyzer
-        
-        config = LumpSumVsDcaConfig()
+        # 경로/디렉토리 준비는 템플릿에서 한 번만 하고 기간별로는 복사 후 분석 파라미터만 변경
+        config = copy(_get_config_template())
         config.set_analysis_params(
             symbol=symbol,
             start_year=start_year,
@@ -54,49 +151,39 @@ def run_single_backtest_silent(symbol: str, start_year: int, start_month: int,
         )
         
         backtester = LumpSumVsDcaBacktester(config)
-        comparison_result = backtester.run_comparison(config.symbol)
+        comparison_result = backtester.run_comparison(config.symbol, _load_price_data(config.symbol))
         
         # 결과 추출
         lump_sum_data = comparison_result['lump_sum']['daily_returns']
         dca_data = comparison_result['dca']['daily_returns']
         
+        # 지표 계산용 컬럼을 NumPy 배열로 한 번만 꺼내 스칼라 접근 (pandas 인덱싱 비용 회피)
+        metric_columns = ('current_value', 'invested_amount', 'drawdown')
+        lump_arr = {k: lump_sum_data[k].to_numpy() for k in metric_columns}
+        dca_arr = {k: dca_data[k].to_numpy() for k in metric_columns}
+        
         # 기본 지표
-        lump_sum_final_value = lump_sum_data['current_value'].iloc[-1]
-        lump_sum_invested = lump_sum_data['invested_amount'].iloc[-1]
+        lump_sum_final_value = lump_arr['current_value'][-1]
+        lump_sum_invested = lump_arr['invested_amount'][-1]
         lump_sum_return = (lump_sum_final_value - lump_sum_invested) / lump_sum_invested
-        lump_sum_mdd = lump_sum_data['drawdown'].min()
+        lump_sum_mdd = lump_arr['drawdown'].min()
         
-        dca_final_value = dca_data['current_value'].iloc[-1]
-        dca_invested = dca_data['invested_amount'].iloc[-1]
+        dca_final_value = dca_arr['current_value'][-1]
+        dca_invested = dca_arr['invested_amount'][-1]
         dca_return = (dca_final_value - dca_invested) / dca_invested
-        dca_mdd = dca_data['drawdown'].min()
+        dca_mdd = dca_arr['drawdown'].min()
         
         # CAGR 계산 (개별 백테스트와 동일한 방식)
         lump_sum_days = len(lump_sum_data)
         dca_days = len(dca_data)
-        lump_sum_years = lump_sum_days / 365.25
-        dca_years = dca_days / 365.25
+        lump_sum_years = lump_sum_days / _ANN
+        dca_years = dca_days / _ANN
         lump_sum_cagr = (lump_sum_final_value / lump_sum_invested) ** (1/lump_sum_years) - 1 if lump_sum_years > 0 else 0
         dca_cagr = (dca_final_value / dca_invested) ** (1/dca_years) - 1 if dca_years > 0 else 0
         
-        # 변동성 & 샤프 (개별 백테스트와 동일한 방식)
-        import numpy as np
-        
-        # total_return 컬럼 사용 (개별 백테스트와 동일)
-        lump_sum_portfolio_returns = lump_sum_data['total_return'].diff().dropna() if 'total_return' in lump_sum_data.columns else lump_sum_data['current_value'].pct_change().dropna()
-        dca_portfolio_returns = dca_data['total_return'].diff().dropna() if 'total_return' in dca_data.columns else dca_data['current_value'].pct_change().dropna()
-        
-        # 365.25일 기준 연환산
-        lump_sum_volatility = lump_sum_portfolio_returns.std() * np.sqrt(365.25) if len(lump_sum_portfolio_returns) > 0 else 0
-        dca_volatility = dca_portfolio_returns.std() * np.sqrt(365.25) if len(dca_portfolio_returns) > 0 else 0
-        
-        # 샤프 지수 (무위험수익률 2% 적용)
-        risk_free_rate = 0.02
-        lump_sum_mean_return = lump_sum_portfolio_returns.mean() * 365.25 if len(lump_sum_portfolio_returns) > 0 else 0
-        dca_mean_return = dca_portfolio_returns.mean() * 365.25 if len(dca_portfolio_returns) > 0 else 0
-        
-        lump_sum_sharpe = (lump_sum_mean_return - risk_free_rate) / lump_sum_volatility if lump_sum_volatility > 0 else 0
-        dca_sharpe = (dca_mean_return - risk_free_rate) / dca_volatility if dca_volatility > 0 else 0
+        # 변동성 & 샤프 (개별 백테스트와 동일한 방식, total_return 컬럼 사용)
+        lump_sum_volatility, lump_sum_sharpe = _annualized_volatility_sharpe(_daily_portfolio_returns(lump_sum_data))
+        dca_volatility, dca_sharpe = _annualized_volatility_sharpe(_daily_portfolio_returns(dca_data))
         
         return {
             'start_year': start_year,
@@ -124,6 +211,317 @@ def run_single_backtest_silent(symbol: str, start_year: int, start_month: int,
         return None
 
 
+@lru_cache(maxsize=None)
+def _load_price_arrays(symbol: str, dtype: str = 'float64') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """롤링 일괄 계산용 가격 배열 (날짜, 1970-01 기준 월 번호, dtype 종가)"""
+    data = _load_price_data(symbol)
+    dates = np.array(data['Date'].tolist(), dtype='datetime64[D]')
+    month_numbers = dates.astype('datetime64[M]').astype(np.int64)
+    closes = data['Close'].to_numpy(np.dtype(dtype))
+    return dates, month_numbers, closes
+
+
+def _first_trading_days(month_numbers: np.ndarray, target_months: np.ndarray) -> np.ndarray:
+    """월별 첫 거래일 인덱스 (데이터가 없는 월은 -1)"""
+    positions = np.searchsorted(month_numbers, target_months, side='left')
+    found = positions < len(month_numbers)
+    found[found] = month_numbers[positions[found]] == target_months[found]
+    return np.where(found, positions, -1)
+
+
+def _window_pass(window_closes: np.ndarray, trade_offsets: np.ndarray, trade_amounts: np.ndarray):
+    """투자 기간을 하루씩 한 번만 순회하며 (최종 가치, 투자 원금, MDD, 일별 수익률 차분) 계산
+    
+    numba가 설치되어 있으면 JIT 컴파일하여 사용 (trade_offsets는 구간 내 오름차순 위치)
+    """
+    n_days = len(window_closes)
+    return_diffs = np.empty(max(n_days - 1, 0))
+    invested = 0.0
+    shares = 0.0
+    next_trade = 0
+    current_value = 0.0
+    peak_return = 0.0
+    mdd = 0.0
+    previous_return = 0.0
+    
+    for day in range(n_days):
+        price = window_closes[day]
+        if next_trade < len(trade_offsets) and trade_offsets[next_trade] == day:
+            invested += trade_amounts[next_trade]
+            shares += trade_amounts[next_trade] / price
+            next_trade += 1
+        
+        if shares > 0:
+            current_value = shares * price
+            total_return = (current_value - invested) / invested
+        else:
+            current_value = 0.0
+            total_return = 0.0
+        
+        if day == 0 or total_return > peak_return:
+            peak_return = total_return
+        if peak_return > 0:
+            drawdown = (total_return - peak_return) / (1 + peak_return)
+        else:
+            drawdown = total_return - peak_return
+        if day == 0 or drawdown < mdd:
+            mdd = drawdown
+        
+        if day > 0:
+            return_diffs[day - 1] = total_return - previous_return
+        previous_return = total_return
+    
+    return current_value, invested, mdd, return_diffs
+
+
+if njit is not None:
+    _window_pass = njit(cache=True, nogil=True)(_window_pass)
+
+
+def _simulate_window_arrays(window_closes: np.ndarray, amounts_by_day: np.ndarray):
+    """_window_pass의 NumPy 배열 연산 버전 (numba 미설치 시 사용)
+    
+    amounts_by_day는 (전략 수, 거래일 수) 매수 금액 행렬로, 같은 종가 배열을 공유하는
+    여러 전략을 행 단위로 한 번에 계산함 (각 전략의 일별 값이 연속 메모리에 놓이도록 행 배치)
+    반환: 전략별 (최종 가치, 투자 원금, MDD) 배열과 (전략 수, 거래일 수 - 1) 일별 수익률 차분
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        invested = np.cumsum(amounts_by_day, axis=1)
+        shares = np.cumsum(amounts_by_day / window_closes, axis=1)
+        holding = shares > 0
+        current_value = np.where(holding, shares * window_closes, 0.0)
+        total_return = np.where(holding, (current_value - invested) / invested, 0.0)
+        
+        # 손실폭은 구간 시작일 기준 누적 최고 수익률에 따라 달라지므로 (구간마다 기준점이 다름)
+        # 전체 시계열로 미리 계산할 수 없음 - 임시 배열 없이 제자리 연산으로 한 번에 계산
+        peak_return = np.maximum.accumulate(total_return, axis=1)
+        drawdown = total_return - peak_return
+        above_zero = peak_return > 0
+        np.add(peak_return, 1, out=peak_return)
+        np.divide(drawdown, peak_return, out=drawdown, where=above_zero)
+    
+    return current_value[:, -1], invested[:, -1], drawdown.min(axis=1), np.diff(total_return, axis=1)
+
+
+def _window_metrics(n_days: int, final_value: float, invested_amount: float, mdd: float,
+                    return_diffs: np.ndarray) -> Dict[str, Any]:
+    """구간 평가 결과로 성과 지표 계산 (float32 배열로 평가한 경우에도 지표는 float64로 계산)"""
+    final_value, invested_amount, mdd = np.float64(final_value), np.float64(invested_amount), np.float64(mdd)
+    return_diffs = return_diffs.astype(np.float64, copy=False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        years = n_days / _ANN
+        volatility, sharpe = _annualized_volatility_sharpe(return_diffs)
+        
+        return {
+            'return': (final_value - invested_amount) / invested_amount,
+            'cagr': (final_value / invested_amount) ** (1 / years) - 1,
+            'mdd': mdd,
+            'sharpe': sharpe,
+            'volatility': volatility,
+            'final_value': final_value,
+        }
+
+
+def _simulate_window(closes: np.ndarray, strategies: List[Tuple[np.ndarray, np.ndarray]],
+                     lo: int, hi: int) -> List[Dict[str, Any]]:
+    """투자 기간 [lo, hi) 구간의 일별 평가를 계산하여 전략별 성과 지표 반환
+    
+    strategies는 전략별 (매수일 인덱스, 매수 금액) 목록이며,
+    Backtester.calculate_daily_returns와 동일한 누적 방식(매수일에 금액/수량 누적)과
+    손실폭 정의를 따름
+    """
+    window_closes = closes[lo:hi]
+    n_days = len(window_closes)
+    
+    if njit is not None:
+        results = []
+        for trade_rows, trade_amounts in strategies:
+            in_window = (trade_rows >= lo) & (trade_rows < hi)
+            final_value, invested_amount, mdd, return_diffs = _window_pass(
+                window_closes, trade_rows[in_window] - lo, trade_amounts[in_window])
+            results.append(_window_metrics(n_days, final_value, invested_amount, mdd, return_diffs))
+        return results
+    
+    # 모든 전략의 매수 금액을 한 행렬에 놓고 종가 배열을 공유하여 한 번에 계산
+    amounts_by_day = np.zeros((len(strategies), n_days), dtype=window_closes.dtype)
+    for row, (trade_rows, trade_amounts) in enumerate(strategies):
+        in_window = (trade_rows >= lo) & (trade_rows < hi)
+        amounts_by_day[row, trade_rows[in_window] - lo] = trade_amounts[in_window]
+    
+    final_values, invested_amounts, mdds, return_diffs = _simulate_window_arrays(window_closes, amounts_by_day)
+    return [_window_metrics(n_days, final_values[row], invested_amounts[row], mdds[row], return_diffs[row])
+            for row in range(len(strategies))]
+
+
+def run_single_backtest_vectorized(symbol: str, start_year: int, start_month: int,
+                                   investment_period_years: int, dca_months: int,
+                                   dtype: str = 'float64') -> Dict[str, Any]:
+    """단일 롤링 기간 결과를 가격 배열에서 직접 계산 (run_single_backtest_silent와 같은 결과)
+    
+    전략 객체/일별 DataFrame을 만들지 않고 매수일 인덱스와 누적합으로 평가하며,
+    가격 배열은 프로세스당 한 번만 준비하여 모든 기간이 공유함
+    dtype='float32'이면 가격/누적 배열을 단정밀도로 계산 (메모리 이동량 절반, 결과는 근사값)
+    """
+    try:
+        dates, month_numbers, closes = _load_price_arrays(symbol, dtype)
+        initial_capital = _get_config_template().initial_capital
+        
+        # 투자 기간 [시작월 1일, 투자기간 후 같은 월 1일)
+        start_month_number = (start_year - 1970) * 12 + (start_month - 1)
+        start_date = np.datetime64(f'{start_year:04d}-{start_month:02d}-01', 'D')
+        end_date = np.datetime64(f'{start_year + investment_period_years:04d}-{start_month:02d}-01', 'D')
+        lo, hi = np.searchsorted(dates, [start_date, end_date], side='left')
+        if hi <= lo:
+            return None
+        
+        # 일시투자: 시작 월 첫 거래일에 전액 매수 (시작 월 데이터가 없으면 실패)
+        lump_sum_rows = _first_trading_days(month_numbers, np.array([start_month_number]))
+        if lump_sum_rows[0] < 0:
+            return None
+        
+        # 적립투자: 매월 첫 거래일에 균등 매수 (데이터가 없는 월은 건너뜀)
+        dca_rows = _first_trading_days(month_numbers, start_month_number + np.arange(dca_months))
+        dca_rows = dca_rows[dca_rows >= 0]
+        
+        lump_sum, dca = _simulate_window(closes, [
+            (lump_sum_rows, np.array([initial_capital], dtype=closes.dtype)),
+            (dca_rows, np.full(len(dca_rows), initial_capital / dca_months, dtype=closes.dtype)),
+        ], lo, hi)
+        
+        return {
+            'start_year': start_year,
+            'start_month': start_month,
+            'period': f"{start_year}-{start_month:02d}",
+            'end_period': f"{start_year + investment_period_years}-{start_month:02d}",
+            'lump_sum_return': lump_sum['return'],
+            'lump_sum_cagr': lump_sum['cagr'],
+            'lump_sum_mdd': lump_sum['mdd'],
+            'lump_sum_sharpe': lump_sum['sharpe'],
+            'lump_sum_volatility': lump_sum['volatility'],
+            'lump_sum_final_value': lump_sum['final_value'],
+            'dca_return': dca['return'],
+            'dca_cagr': dca['cagr'],
+            'dca_mdd': dca['mdd'],
+            'dca_sharpe': dca['sharpe'],
+            'dca_volatility': dca['volatility'],
+            'dca_final_value': dca['final_value'],
+            'return_difference': lump_sum['return'] - dca['return'],
+            'cagr_difference': lump_sum['cagr'] - dca['cagr'],
+            'value_difference': lump_sum['final_value'] - dca['final_value'],
+        }
+        
+    except Exception:
+        return None
+
+
+def _to_record(result: Dict[str, Any]) -> Tuple:
+    """결과 딕셔너리를 _RESULT_DTYPE 필드 순서의 튜플로 변환 (실패한 기간은 None)"""
+    if not result:
+        return None
+    return tuple(result[name] for name in _RESULT_DTYPE.names)
+
+
+def _records_to_dataframe(records: np.ndarray, investment_period_years: int) -> pd.DataFrame:
+    """결과 레코드 배열을 DataFrame으로 변환 (컬럼 순서는 결과 딕셔너리와 동일)"""
+    start_years = records['start_year'].tolist()
+    start_months = records['start_month'].tolist()
+    columns = {
+        'start_year': records['start_year'],
+        'start_month': records['start_month'],
+        'period': [f"{year}-{month:02d}" for year, month in zip(start_years, start_months)],
+        'end_period': [f"{year + investment_period_years}-{month:02d}" for year, month in zip(start_years, start_months)],
+    }
+    for name in _RESULT_DTYPE.names[2:]:
+        columns[name] = records[name]
+    return pd.DataFrame(columns, copy=False)
+
+
+def _run_single_backtest_args(args: Tuple) -> Tuple:
+    """프로세스 풀용 래퍼 (인자 튜플을 풀어서 실행, 결과는 피클 크기가 작은 레코드 튜플로 반환)"""
+    return _to_record(run_single_backtest_silent(*args))
+
+
+def _iter_backtest_results(params: List[Tuple], max_workers: int,
+                           worker=_run_single_backtest_args) -> Iterator[Tuple]:
+    """기간별 백테스트 결과를 입력 순서대로 반환 (max_workers > 1이면 프로세스 병렬 실행)
+    
+    worker는 인자 튜플을 받아 레코드 튜플을 반환하는 모듈 수준 함수 (프로세스로 피클링 가능해야 함)
+    """
+    completed = 0
+    if max_workers > 1 and len(params) > 1:
+        try:
+            chunksize = max(1, len(params) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for result in executor.map(worker, params, chunksize=chunksize):
+                    completed += 1
+                    yield result
+            return
+        except (OSError, BrokenProcessPool, PicklingError) as e:
+            print(f"\n⚠️ 병렬 실행 실패, 남은 {len(params) - completed}개는 순차 실행으로 전환: {e}")
+    
+    for args in params[completed:]:
+        yield worker(args)
+
+
+def _run_single_backtest_vectorized_args(args: Tuple) -> Tuple:
+    """스레드 풀용 래퍼 (인자 튜플을 풀어서 실행, 결과는 레코드 튜플로 반환)"""
+    return _to_record(run_single_backtest_vectorized(*args))
+
+
+def _iter_vectorized_results(params: List[Tuple], max_workers: int) -> Iterator[Tuple]:
+    """벡터화 경로 결과를 입력 순서대로 반환
+    
+    numba 커널은 GIL을 해제하므로 numba가 있고 max_workers > 1이면 스레드 병렬 실행
+    (가격 배열은 프로세스 내 캐시를 복사 없이 공유, 프로세스 생성/피클링 비용 없음)
+    numba가 없으면 NumPy 연산이 대부분 GIL을 잡고 있으므로 프로세스 병렬 실행
+    (가격 배열은 프로세스마다 한 번만 준비)
+    """
+    if max_workers <= 1 or len(params) <= 1:
+        for args in params:
+            yield _run_single_backtest_vectorized_args(args)
+        return
+    
+    if njit is None:
+        yield from _iter_backtest_results(params, max_workers, _run_single_backtest_vectorized_args)
+        return
+    
+    # 첫 기간은 먼저 실행하여 가격 배열 캐시를 준비 (스레드마다 중복 로드 방지)
+    yield _run_single_backtest_vectorized_args(params[0])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_run_single_backtest_vectorized_args, params[1:])
+
+
+def _submit_chart_generation(chart_generator: RollingChartGenerator, df: pd.DataFrame):
+    """차트 생성을 별도 프로세스에서 시작 (단일 코어 환경이거나 시작 실패 시 None)
+    
+    엑셀 저장과 겹치는 것이 목적이므로 워커 안에서는 차트를 순차 생성 (프로세스 풀 중첩 방지)
+    """
+    # 단일 코어에서는 엑셀 저장과 겹쳐도 이득이 없으므로 나중에 현재 프로세스에서 생성
+    if (os.cpu_count() or 1) < 2:
+        return None
+    try:
+        executor = ProcessPoolExecutor(max_workers=1)
+        return executor, executor.submit(chart_generator.generate_all_charts, df, parallel=False)
+    except OSError as e:
+        print(f"⚠️ 차트 생성 프로세스 시작 실패: {e}")
+        return None
+
+
+def _collect_chart_generation(chart_job, chart_generator: RollingChartGenerator,
+                              df: pd.DataFrame) -> Dict[str, str]:
+    """별도 프로세스의 차트 생성 결과 수집 (실패하거나 시작하지 않았으면 현재 프로세스에서 생성)"""
+    if chart_job is not None:
+        executor, future = chart_job
+        try:
+            return future.result()
+        except (OSError, BrokenProcessPool, PicklingError, TypeError, AttributeError) as e:
+            # 피클링 실패는 TypeError/AttributeError로도 전달됨
+            print(f"⚠️ 별도 프로세스 차트 생성 실패, 현재 프로세스에서 생성: {e}")
+        finally:
+            executor.shutdown()
+    return chart_generator.generate_all_charts(df)
+
+
 def run_batch():
     """롤링 백테스트 실행"""
     
@@ -137,14 +535,9 @@ def run_batch():
     DCA_MONTHS = BATCH_CONFIG['dca_months']
     GENERATE_CHARTS = BATCH_CONFIG.get('generate_charts', True)
     
-    # 전체 테스트 기간 생성
-    test_periods = []
-    current_date = datetime(START_YEAR, START_MONTH, 1)
-    end_date = datetime(END_YEAR, END_MONTH, 1)
-    
-    while current_date <= end_date:
-        test_periods.append((current_date.year, current_date.month))
-        current_date = current_date + relativedelta(months=1)
+    # 전체 테스트 기간 생성 (매월 1일 기준 월 단위 범위)
+    period_dates = pd.date_range(datetime(START_YEAR, START_MONTH, 1), datetime(END_YEAR, END_MONTH, 1), freq='MS')
+    test_periods = list(zip(period_dates.year.tolist(), period_dates.month.tolist()))
     
     print(f"🚀 롤링 백테스트 실행")
     print(f"📊 지수: {SYMBOL}")
@@ -154,30 +547,48 @@ def run_batch():
     print(f"📋 테스트 기간: {len(test_periods)}개")
     print("-" * 60)
     
-    results = []
+    params = [(SYMBOL, year, month, INVESTMENT_PERIOD_YEARS, DCA_MONTHS) for year, month in test_periods]
+    max_workers = BATCH_CONFIG.get('max_workers') or os.cpu_count() or 1
+    vectorized = BATCH_CONFIG.get('vectorized', True)
+    price_dtype = BATCH_CONFIG.get('price_dtype', 'float64')
     
-    for i, (year, month) in enumerate(test_periods, 1):
+    # 가격 데이터는 병렬 실행 전에 현재 프로세스에서 한 번만 준비
+    # (fork로 생성되는 작업 프로세스와 스레드는 이 캐시를 그대로 공유하여 기간/프로세스마다 CSV를 다시 읽지 않음)
+    try:
+        if vectorized:
+            _load_price_arrays(SYMBOL, price_dtype)
+        else:
+            _load_price_data(SYMBOL)
+    except Exception:
+        pass  # 데이터 준비 실패는 기간별 실행에서 실패로 처리됨
+    
+    if vectorized:
+        # 가격 배열을 한 번 준비하고 기간별 지표를 배열 연산으로 계산 (numba 사용 시 스레드 병렬)
+        backtest_results = _iter_vectorized_results([args + (price_dtype,) for args in params], max_workers)
+    else:
+        # 기간별 백테스트는 서로 독립적이므로 프로세스 병렬 실행 (단일 코어면 순차 실행)
+        backtest_results = _iter_backtest_results(params, max_workers)
+    
+    # 결과는 고정 dtype 레코드 배열에 순서대로 채움 (딕셔너리 리스트 → DataFrame 타입 추론 생략)
+    records = np.empty(len(params), dtype=_RESULT_DTYPE)
+    count = 0
+    for i, ((year, month), record) in enumerate(zip(test_periods, backtest_results), 1):
         print(f"[{i:3d}] {year}-{month:02d} ~ {year + INVESTMENT_PERIOD_YEARS}-{month:02d} 테스트 중...", end=" ")
         
-        result = run_single_backtest_silent(
-            symbol=SYMBOL,
-            start_year=year,
-            start_month=month,
-            investment_period_years=INVESTMENT_PERIOD_YEARS,
-            dca_months=DCA_MONTHS
-        )
-        
-        if result:
-            results.append(result)
-            print(f"✅ (일시:{result['lump_sum_return']:.1%}, 적립:{result['dca_return']:.1%})")
+        if record:
+            records[count] = record
+            result = records[count]
+            count += 1
+            print(f"✅ (일시:{result['lump_sum_return']*100:.1f}%, 적립:{result['dca_return']*100:.1f}%)")
         else:
             print("❌")
+    records = records[:count]
     
     print("-" * 60)
-    print(f"✅ 롤링 백테스트 완료: {len(results)}/{len(test_periods)}개 성공")
+    print(f"✅ 롤링 백테스트 완료: {count}/{len(test_periods)}개 성공")
     
     # 결과 저장
-    if results:
+    if count:
         # 롤링 백테스트 세션 디렉토리 생성
         current_dir = Path(__file__).parent
         project_root = current_dir.parent.parent  # src -> boksl_quant 
@@ -192,20 +603,12 @@ def run_batch():
         filename = f"rolling_{SYMBOL}_{START_YEAR}{START_MONTH:02d}_{END_YEAR}{END_MONTH:02d}.xlsx"
         filepath = results_dir / filename
         
-        # DataFrame 생성 및 고급 엑셀 스타일 적용
-        df = pd.DataFrame(results)
-        _create_styled_excel(df, filepath, START_YEAR, END_YEAR, SYMBOL, INVESTMENT_PERIOD_YEARS, DCA_MONTHS)
-        
-        print(f"📊 결과 저장: {filepath}")
-        
-        # 요약 통계
-        if len(results) > 5:
-            lump_avg = df['lump_sum_return'].mean()
-            dca_avg = df['dca_return'].mean()
-            lump_win_rate = (df['return_difference'] > 0).mean()
-            print(f"📈 요약: 일시투자 {lump_avg:.1%}, 적립투자 {dca_avg:.1%}, 일시투자 승률 {lump_win_rate:.1%}")
+        # DataFrame 생성
+        df = _records_to_dataframe(records, INVESTMENT_PERIOD_YEARS)
         
-        # 인사이트 차트 생성 (설정에 따라)
+        # 인사이트 차트 생성 (설정에 따라, 가능하면 별도 프로세스에서 엑셀 저장과 동시에 렌더링)
+        chart_generator = None
+        chart_job = None
         if GENERATE_CHARTS:
             print("\n📊 인사이트 차트 생성 중...")
             chart_generator = RollingChartGenerator(
@@ -216,8 +619,22 @@ def run_batch():
                 dca_months=DCA_MONTHS,
                 chart_dir=str(results_dir)  # 세션 디렉토리를 차트 디렉토리로 사용
             )
-            
-            chart_files = chart_generator.generate_all_charts(results)
+            chart_job = _submit_chart_generation(chart_generator, df)
+        
+        # 고급 엑셀 스타일 적용
+        _create_styled_excel(df, filepath, START_YEAR, END_YEAR, SYMBOL, INVESTMENT_PERIOD_YEARS, DCA_MONTHS)
+        
+        print(f"📊 결과 저장: {filepath}")
+        
+        # 요약 통계
+        if count > 5:
+            lump_avg = df['lump_sum_return'].mean()
+            dca_avg = df['dca_return'].mean()
+            lump_win_rate = (df['return_difference'] > 0).mean()
+            print(f"📈 요약: 일시투자 {lump_avg*100:.1f}%, 적립투자 {dca_avg*100:.1f}%, 일시투자 승률 {lump_win_rate*100:.1f}%")
+        
+        if chart_generator is not None:
+            chart_files = _collect_chart_generation(chart_job, chart_generator, df)
             print(f"📊 차트 생성 완료: {len(chart_files)}개 파일")
             for chart_name, chart_path in chart_files.items():
                 print(f"  - {chart_name}: {Path(chart_path).name}")
@@ -249,60 +666,38 @@ def _create_styled_excel(df: pd.DataFrame, filepath: Path, start_year: int, end_
                         symbol: str, investment_period_years: int, dca_months: int):
     """고급 스타일링이 적용된 엑셀 파일 생성"""
     
-    # 컬럼 한글화 및 순서 정리
-    df_styled = df.copy()
-    
-    # 불필요한 컬럼 제거 (시작년도, 시작월은 시작기간과 중복)
-    columns_to_drop = ['start_year', 'start_month']
-    df_styled = df_styled.drop(columns=[col for col in columns_to_drop if col in df_styled.columns])
-    
-    # 컬럼 순서 및 한글화
-    column_mapping = {
-        'period': '시작기간',
-        'end_period': '종료기간',
-        'lump_sum_return': '일시투자_수익률',
-        'lump_sum_cagr': '일시투자_CAGR',
-        'lump_sum_mdd': '일시투자_MDD',
-        'lump_sum_sharpe': '일시투자_샤프지수',
-        'lump_sum_volatility': '일시투자_변동성',
-        'lump_sum_final_value': '일시투자_최종가치',
-        'dca_return': '적립투자_수익률',
-        'dca_cagr': '적립투자_CAGR',
-        'dca_mdd': '적립투자_MDD',
-        'dca_sharpe': '적립투자_샤프지수',
-        'dca_volatility': '적립투자_변동성',
-        'dca_final_value': '적립투자_최종가치',
-        'return_difference': '수익률차이',
-        'cagr_difference': 'CAGR차이',
-        'value_difference': '가치차이'
-    }
+    # 한글 헤더와 컬럼별 값 목록만 준비 (중간 DataFrame 없이 바로 기록, 시작년도/시작월은 시작기간과 중복이라 제외)
+    columns = [column for column in _EXCEL_COLUMN_NAMES if column in df.columns]
+    headers = [_EXCEL_COLUMN_NAMES[column] for column in columns]
+    column_values = [df[column].tolist() for column in columns]
     
-    df_styled = df_styled.rename(columns=column_mapping)
-    
-    # 워크북 생성
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # 기본 시트 제거
+    # 워크북 생성 (write-only: 셀을 메모리에 유지하지 않고 행 단위로 기록)
+    wb = openpyxl.Workbook(write_only=True)
     
     # 메인 시트 생성
     ws = wb.create_sheet("롤링백테스트결과")
     
-    # 제목 추가
-    title = f"{symbol} 롤링백테스트 결과 ({start_year}~{end_year}, {investment_period_years}년 투자, {dca_months}개월 적립)"
-    ws['A1'] = title
-    ws['A1'].font = Font(size=14, bold=True)
-    ws['A1'].alignment = Alignment(horizontal='center')
-    ws.merge_cells('A1:Q1')  # 제목 셀 병합 (컬럼 수 조정: 19개 -> 17개)
-    
-    # 데이터 추가 (3행부터)
-    for r_idx, row in enumerate(df_styled.values, 3):
-        for c_idx, value in enumerate(row, 1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
+    # 열 너비 및 머리행 고정 (write-only 시트는 행 기록 전에 설정해야 함)
+    column_widths = {
+        '시작기간': 12, '종료기간': 12,
+        '일시투자_수익률': 15, '일시투자_CAGR': 15, '일시투자_MDD': 15, 
+        '일시투자_샤프지수': 15, '일시투자_변동성': 15, '일시투자_최종가치': 18,
+        '적립투자_수익률': 15, '적립투자_CAGR': 15, '적립투자_MDD': 15,
+        '적립투자_샤프지수': 15, '적립투자_변동성': 15, '적립투자_최종가치': 18,
+        '수익률차이': 12, 'CAGR차이': 12, '가치차이': 15
+    }
+    for col_idx, col_name in enumerate(headers, 1):
+        column_letter = openpyxl.utils.get_column_letter(col_idx)
+        ws.column_dimensions[column_letter].width = column_widths.get(col_name, 12)
+    ws.freeze_panes = 'A3'  # 제목과 헤더 고정
     
-    # 헤더 추가 (2행)
-    for c_idx, column in enumerate(df_styled.columns, 1):
-        cell = ws.cell(row=2, column=c_idx, value=column)
-        cell.font = Font(bold=True)  # 개별 백테스트와 동일하게 검정색으로 수정
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+    # 제목 추가 (제목 셀 병합, 컬럼 수 17개)
+    title = f"{symbol} 롤링백테스트 결과 ({start_year}~{end_year}, {investment_period_years}년 투자, {dca_months}개월 적립)"
+    title_cell = WriteOnlyCell(ws, value=title)
+    title_cell.font = Font(size=14, bold=True)
+    title_cell.alignment = Alignment(horizontal='center')
+    ws.append([title_cell])
+    ws.merged_cells.add('A1:Q1')
     
     # 색상 정의 (개별 백테스트와 동일하게 수정)
     header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")  # 헤더 회색
@@ -319,62 +714,59 @@ def _create_styled_excel(df: pd.DataFrame, filepath: Path, start_year: int, end_
         bottom=Side(style='thin')
     )
     
-    # 헤더 스타일 적용
-    for col in range(1, len(df_styled.columns) + 1):
-        cell = ws.cell(row=2, column=col)
+    # 헤더 추가 (2행)
+    header_row = []
+    for column in headers:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = Font(bold=True)  # 개별 백테스트와 동일하게 검정색으로 수정
+        cell.alignment = Alignment(horizontal='center', vertical='center')
         cell.fill = header_fill
         cell.border = thin_border
+        header_row.append(cell)
+    ws.append(header_row)
     
-    # 데이터 행 스타일 적용
-    for row in range(3, len(df_styled) + 3):
-        for col in range(1, len(df_styled.columns) + 1):
-            cell = ws.cell(row=row, column=col)
-            cell.border = thin_border
+    # 컬럼별 스타일을 한 번만 등록하고 데이터 셀에는 스타일 ID만 복사
+    column_styles = []
+    for col_name in headers:
+        cell = WriteOnlyCell(ws)
+        cell.border = thin_border
+        
+        # 컬럼별 배경색 및 정렬 적용
+        if col_name in ['시작기간', '종료기간']:
+            cell.fill = common_fill
+            # 텍스트 데이터는 중앙 정렬
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+        elif '일시투자_' in col_name:
+            cell.fill = lump_sum_fill
+            # 수치 데이터는 오른쪽 정렬
+            cell.alignment = Alignment(horizontal='right', vertical='center')
+        elif '적립투자_' in col_name:
+            cell.fill = dca_fill
+            # 수치 데이터는 오른쪽 정렬
+            cell.alignment = Alignment(horizontal='right', vertical='center')
+        elif '차이' in col_name:
+            cell.fill = difference_fill
+            # 수치 데이터는 오른쪽 정렬
+            cell.alignment = Alignment(horizontal='right', vertical='center')
             
-            # 컬럼별 배경색 및 정렬 적용
-            col_name = df_styled.columns[col-1]
-            if col_name in ['시작기간', '종료기간']:
-                cell.fill = common_fill
-                # 텍스트 데이터는 중앙 정렬
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-            elif '일시투자_' in col_name:
-                cell.fill = lump_sum_fill
-                # 수치 데이터는 오른쪽 정렬
-                cell.alignment = Alignment(horizontal='right', vertical='center')
-            elif '적립투자_' in col_name:
-                cell.fill = dca_fill
-                # 수치 데이터는 오른쪽 정렬
-                cell.alignment = Alignment(horizontal='right', vertical='center')
-            elif '차이' in col_name:
-                cell.fill = difference_fill
-                # 수치 데이터는 오른쪽 정렬
-                cell.alignment = Alignment(horizontal='right', vertical='center')
-                
-            # 숫자 포맷 적용 (개별 백테스트와 동일하게 수정)
-            if '수익률' in col_name or 'CAGR' in col_name or 'MDD' in col_name or '변동성' in col_name:
-                cell.number_format = FORMAT_PERCENTAGE_00
-                # 데이터 값 조정 제거 (개별 백테스트와 동일하게 소수값 그대로 사용)
-            elif '가치' in col_name or ('차이' in col_name and col_name == '가치차이'):
-                cell.number_format = "#,##0"  # 소수점 없는 금액 형식으로 수정
-            elif '샤프지수' in col_name:
-                cell.number_format = '0.00'  # 소수점 2자리로 수정
-    
-    # 열 너비 자동 조정 (불필요한 컬럼 제거)
-    column_widths = {
-        '시작기간': 12, '종료기간': 12,
-        '일시투자_수익률': 15, '일시투자_CAGR': 15, '일시투자_MDD': 15, 
-        '일시투자_샤프지수': 15, '일시투자_변동성': 15, '일시투자_최종가치': 18,
-        '적립투자_수익률': 15, '적립투자_CAGR': 15, '적립투자_MDD': 15,
-        '적립투자_샤프지수': 15, '적립투자_변동성': 15, '적립투자_최종가치': 18,
-        '수익률차이': 12, 'CAGR차이': 12, '가치차이': 15
-    }
+        # 숫자 포맷 적용 (개별 백테스트와 동일하게 수정)
+        if '수익률' in col_name or 'CAGR' in col_name or 'MDD' in col_name or '변동성' in col_name:
+            cell.number_format = FORMAT_PERCENTAGE_00
+            # 데이터 값 조정 제거 (개별 백테스트와 동일하게 소수값 그대로 사용)
+        elif '가치' in col_name or ('차이' in col_name and col_name == '가치차이'):
+            cell.number_format = "#,##0"  # 소수점 없는 금액 형식으로 수정
+        elif '샤프지수' in col_name:
+            cell.number_format = '0.00'  # 소수점 2자리로 수정
+        column_styles.append(cell._style)
     
-    for col_idx, col_name in enumerate(df_styled.columns, 1):
-        column_letter = openpyxl.utils.get_column_letter(col_idx)
-        ws.column_dimensions[column_letter].width = column_widths.get(col_name, 12)
-    
-    # 머리행 고정 (제목과 헤더 고정)
-    ws.freeze_panes = 'A3'
+    # 데이터 추가 (3행부터)
+    for row in zip(*column_values):
+        styled_row = []
+        for value, style in zip(row, column_styles):
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(style)
+            styled_row.append(cell)
+        ws.append(styled_row)
     
     # 워크북 저장
     wb.save(filepath)
@@ -2,36 +2,112 @@
 투자 전략 기본 클래스
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
 
+from backtester import cached_frame_arrays
+
+
+def _build_price_arrays(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """가격 데이터의 (거래일, 1970-01 기준 월 번호, 종가) 배열"""
+    days = pd.to_datetime(data['Date']).to_numpy('datetime64[D]')
+    month_numbers = days.astype('datetime64[M]').astype(np.int64)
+    return days, month_numbers, data['Close'].to_numpy(np.float64)
+
 
 class BaseStrategy(ABC):
     """투자 전략 기본 클래스"""
     
     def __init__(self, config):
         self.config = config
-        self.trades = []
-        self.portfolio = {
-            'total_invested': 0,
-            'total_shares': 0,
-            'average_price': 0
-        }
+        self._total_invested = 0
+        self._total_shares = 0
+        self._trades_cache = None
+        self._preallocate(0)
+    
+    def _preallocate(self, n: int):
+        """앞으로 추가될 거래 n건만큼 거래 기록 배열을 미리 할당 (기존 기록은 유지)"""
+        count = getattr(self, '_idx', 0)
+        for name, dtype in (('_dates', 'datetime64[D]'), ('_prices', np.float64),
+                            ('_amounts', np.float64), ('_shares', np.float64)):
+            new = np.empty(count + n, dtype=dtype)
+            if count:
+                new[:count] = getattr(self, name)[:count]
+            setattr(self, name, new)
+        self._idx = count
     
     def add_trade(self, date: str, price: float, amount: float, shares: float):
         """거래 기록 추가"""
-        self.trades.append({
-            'date': date,
-            'price': price,
-            'amount': amount,
-            'shares': shares
-        })
+        if self._idx == len(self._prices):
+            self._preallocate(max(self._idx, 1))
+        
+        i = self._idx
+        self._dates[i] = date
+        self._prices[i] = price
+        self._amounts[i] = amount
+        self._shares[i] = shares
+        self._idx = i + 1
+        self._trades_cache = None
+        
+        # 포트폴리오 누적값 업데이트 (평균 단가는 조회 시 계산)
+        self._total_invested += amount
+        self._total_shares += shares
+    
+    def add_trades(self, dates: np.ndarray, prices: np.ndarray, amounts: np.ndarray, shares: np.ndarray):
+        """거래 기록 일괄 추가 (add_trade를 순서대로 호출한 것과 같은 결과)"""
+        n = len(prices)
+        if n == 0:
+            return
+        if self._idx + n > len(self._prices):
+            self._preallocate(n)
         
-        # 포트폴리오 업데이트
-        self.portfolio['total_invested'] += amount
-        self.portfolio['total_shares'] += shares
-        if self.portfolio['total_shares'] > 0:
-            self.portfolio['average_price'] = self.portfolio['total_invested'] / self.portfolio['total_shares']
+        i = self._idx
+        self._dates[i:i + n] = dates
+        self._prices[i:i + n] = prices
+        self._amounts[i:i + n] = amounts
+        self._shares[i:i + n] = shares
+        self._idx = i + n
+        self._trades_cache = None
+        
+        # 포트폴리오 누적값 업데이트 (cumsum은 앞에서부터 순서대로 더하므로 한 건씩 더한 값과 같음)
+        self._total_invested = np.cumsum(np.concatenate(([self._total_invested], amounts)))[-1].item()
+        self._total_shares = np.cumsum(np.concatenate(([self._total_shares], shares)))[-1].item()
+    
+    @property
+    def trades(self) -> List[Dict[str, Any]]:
+        """거래 기록 (필요할 때만 딕셔너리 리스트로 변환)"""
+        if self._trades_cache is None:
+            n = self._idx
+            self._trades_cache = [
+                {'date': date, 'price': price, 'amount': amount, 'shares': shares}
+                for date, price, amount, shares in zip(
+                    np.datetime_as_string(self._dates[:n], unit='D').tolist(),
+                    self._prices[:n].tolist(),
+                    self._amounts[:n].tolist(),
+                    self._shares[:n].tolist()
+                )
+            ]
+        return self._trades_cache
+    
+    @property
+    def portfolio(self) -> Dict[str, float]:
+        """포트폴리오 현황"""
+        average_price = self._total_invested / self._total_shares if self._total_shares > 0 else 0
+        return {
+            'total_invested': self._total_invested,
+            'total_shares': self._total_shares,
+            'average_price': average_price
+        }
+    
+    @staticmethod
+    def _price_arrays(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """가격 데이터의 (거래일, 1970-01 기준 월 번호, 종가) 배열
+        
+        DataFrame에 컬럼을 추가하지 않고 별도 배열로 보관하며, 같은 DataFrame으로
+        반복 실행하면 날짜 변환 없이 재사용
+        """
+        return cached_frame_arrays(data, _build_price_arrays)
     
     @abstractmethod
     def execute(self, data: pd.DataFrame) -> Dict[str, Any]:
@@ -40,9 +116,10 @@ class BaseStrategy(ABC):
     
     def get_summary(self) -> Dict[str, Any]:
         """전략 실행 결과 요약"""
+        portfolio = self.portfolio
         return {
-            'trades_count': len(self.trades),
-            'total_invested': self.portfolio['total_invested'],
-            'total_shares': self.portfolio['total_shares'],
-            'average_price': self.portfolio['average_price']
-        }
\ No newline at end of file
+            'trades_count': self._idx,
+            'total_invested': portfolio['total_invested'],
+            'total_shares': portfolio['total_shares'],
+            'average_price': portfolio['average_price']
+        }
@@ -1,20 +1,11 @@
 """
 적립투자 전략
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
-# 모듈 경로 설정
-import os
-import importlib.util
-
-current_dir = os.path.dirname(os.path.abspath(__file__))
-base_strategy_path = os.path.join(current_dir, 'base_strategy.py')
-
-# BaseStrategy 직접 import
-spec = importlib.util.spec_from_file_location("base_strategy", base_strategy_path)
-base_strategy_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(base_strategy_module)
-BaseStrategy = base_strategy_module.BaseStrategy
+# 두 전략이 같은 BaseStrategy 모듈 객체를 공유하도록 일반 import 사용 (sys.modules 캐시)
+from strategies.base_strategy import BaseStrategy
 
 
 class DollarCostAverageStrategy(BaseStrategy):
@@ -22,42 +13,26 @@ class DollarCostAverageStrategy(BaseStrategy):
     
     def execute(self, data: pd.DataFrame) -> Dict[str, Any]:
         """적립투자 실행"""
-        # 날짜 컬럼 처리
-        data['date'] = data['Date']
-        data['year'] = pd.to_datetime(data['Date']).dt.year
-        data['month'] = pd.to_datetime(data['Date']).dt.month
+        days, month_numbers, closes = self._price_arrays(data)
         
-        monthly_amount = self.config.get_dca_monthly_amount()
+        # 매월 첫 거래일 위치를 한 번에 구함 (거래일 오름차순 정렬, 데이터가 없는 월은 건너뜀)
+        start_month_number = (self.config.start_year - 1970) * 12 + (self.config.start_month - 1)
+        target_months = start_month_number + np.arange(self.config.dca_months)
+        rows = np.searchsorted(month_numbers, target_months)
+        found = rows < len(month_numbers)
+        found[found] = month_numbers[rows[found]] == target_months[found]
+        rows = rows[found]
         
-        # 적립투자 실행
-        current_year = self.config.start_year
-        current_month = self.config.start_month
+        monthly_amount = self.config.get_dca_monthly_amount()
         
-        for _ in range(self.config.dca_months):
-            # 해당 년월의 첫 거래일 찾기
-            month_data = data[
-                (data['year'] == current_year) & 
-                (data['month'] == current_month)
-            ]
-            
-            if not month_data.empty:
-                first_trade_day = month_data.iloc[0]
-                investment_price = first_trade_day['Close']
-                shares = monthly_amount / investment_price
-                
-                # 거래 기록
-                self.add_trade(
-                    date=str(first_trade_day['date']),
-                    price=investment_price,
-                    amount=monthly_amount,
-                    shares=shares
-                )
-            
-            # 다음 월로 이동
-            current_month += 1
-            if current_month > 12:
-                current_month = 1
-                current_year += 1
+        # 적립투자 실행 (매수일별 거래를 배열 연산으로 한 번에 기록)
+        prices = closes[rows]
+        self.add_trades(
+            dates=days[rows],
+            prices=prices,
+            amounts=np.full(len(rows), monthly_amount),
+            shares=monthly_amount / prices
+        )
         
         return {
             'strategy': 'dca',
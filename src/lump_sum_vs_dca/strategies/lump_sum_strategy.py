@@ -1,20 +1,11 @@
 """
 일시투자 전략
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
-# 모듈 경로 설정
-import os
-import importlib.util
-
-current_dir = os.path.dirname(os.path.abspath(__file__))
-base_strategy_path = os.path.join(current_dir, 'base_strategy.py')
-
-# BaseStrategy 직접 import
-spec = importlib.util.spec_from_file_location("base_strategy", base_strategy_path)
-base_strategy_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(base_strategy_module)
-BaseStrategy = base_strategy_module.BaseStrategy
+# 두 전략이 같은 BaseStrategy 모듈 객체를 공유하도록 일반 import 사용 (sys.modules 캐시)
+from strategies.base_strategy import BaseStrategy
 
 
 class LumpSumStrategy(BaseStrategy):
@@ -22,29 +13,25 @@ class LumpSumStrategy(BaseStrategy):
     
     def execute(self, data: pd.DataFrame) -> Dict[str, Any]:
         """일시투자 실행"""
-        # 투자 시작 년월의 첫 거래일 찾기
-        data['date'] = data['Date']
-        data['year'] = pd.to_datetime(data['Date']).dt.year
-        data['month'] = pd.to_datetime(data['Date']).dt.month
+        days, month_numbers, closes = self._price_arrays(data)
         
-        # 시작 년월 데이터 필터링
-        start_data = data[
-            (data['year'] == self.config.start_year) & 
-            (data['month'] == self.config.start_month)
-        ]
+        # 투자 시작 년월의 첫 거래일 위치 (거래일 오름차순 정렬 상태이므로 전체 비교 대신 이진 탐색)
+        start_month_number = (self.config.start_year - 1970) * 12 + (self.config.start_month - 1)
+        first_row = np.searchsorted(month_numbers, start_month_number)
         
-        if start_data.empty:
+        if first_row == len(month_numbers) or month_numbers[first_row] != start_month_number:
             raise ValueError(f"투자 시작 시점({self.config.start_year}-{self.config.start_month:02d})에 데이터가 없습니다.")
         
         # 첫 거래일 데이터
-        first_trade_day = start_data.iloc[0]
-        investment_price = first_trade_day['Close']
+        trade_date = days[first_row]
+        investment_price = closes[first_row].item()
         investment_amount = self.config.initial_capital
         shares = investment_amount / investment_price
         
         # 거래 기록
+        self._preallocate(1)
         self.add_trade(
-            date=str(first_trade_day['date']),
+            date=str(trade_date),
             price=investment_price,
             amount=investment_amount,
             shares=shares
@@ -8,12 +8,16 @@ from strategies.dca_strategy import DollarCostAverageStrategy
 class LumpSumVsDcaStrategyFactory:
     """일시투자 vs 적립투자 전략 팩토리"""
     
+    # 전략 타입별 클래스 (문자열 비교 분기 대신 한 번의 조회로 선택)
+    STRATEGY_CLASSES = {
+        'lump_sum': LumpSumStrategy,
+        'dca': DollarCostAverageStrategy,
+    }
+    
     @staticmethod
     def create_strategy(strategy_type: str, config):
         """전략 생성"""
-        if strategy_type == 'lump_sum':
-            return LumpSumStrategy(config)
-        elif strategy_type == 'dca':
-            return DollarCostAverageStrategy(config)
-        else:
-            raise ValueError(f"지원하지 않는 전략 타입: {strategy_type}")
\ No newline at end of file
+        strategy_class = LumpSumVsDcaStrategyFactory.STRATEGY_CLASSES.get(strategy_type)
+        if strategy_class is None:
+            raise ValueError(f"지원하지 않는 전략 타입: {strategy_type}")
+        return strategy_class(config)
\ No newline at end of file